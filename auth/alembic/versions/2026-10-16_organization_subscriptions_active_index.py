@@ -0,0 +1,42 @@
+"""organization_subscriptions_active_index
+
+Revision ID: 8a3f61c2d7e5
+Revises: 5e0b7d3c9a41
+Create Date: 2026-10-16 13:10:27.516344
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8a3f61c2d7e5"
+down_revision = "5e0b7d3c9a41"
+branch_labels = None
+depends_on = None
+
+# Same predicate as OrganizationSubscription's index. Enums are stored by name.
+# expires_at is not part of it, so queries still have to check it.
+ACTIVE_STATUSES_CLAUSE = sa.text("status IN ('ACTIVE', 'TRIALING')")
+
+
+def upgrade():
+    table_prefix = op.get_context().opts["table_prefix"]
+
+    op.create_index(
+        op.f(f"ix_{table_prefix}organization_subscriptions_active"),
+        f"{table_prefix}organization_subscriptions",
+        ["organization_id", "status"],
+        unique=False,
+        postgresql_where=ACTIVE_STATUSES_CLAUSE,
+        sqlite_where=ACTIVE_STATUSES_CLAUSE,
+    )
+
+
+def downgrade():
+    table_prefix = op.get_context().opts["table_prefix"]
+
+    op.drop_index(
+        op.f(f"ix_{table_prefix}organization_subscriptions_active"),
+        table_name=f"{table_prefix}organization_subscriptions",
+    )
@@ -0,0 +1,45 @@
+"""stripe_lookup_indexes
+
+Revision ID: 3b9e0f4a6c18
+Revises: 8a3f61c2d7e5
+Create Date: 2026-10-16 14:02:51.207493
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3b9e0f4a6c18"
+down_revision = "8a3f61c2d7e5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    table_prefix = op.get_context().opts["table_prefix"]
+
+    op.create_index(
+        op.f(f"ix_{table_prefix}users_stripe_customer_id"),
+        f"{table_prefix}users",
+        ["stripe_customer_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f(f"ix_{table_prefix}organization_subscriptions_stripe_subscription_id"),
+        f"{table_prefix}organization_subscriptions",
+        ["stripe_subscription_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    table_prefix = op.get_context().opts["table_prefix"]
+
+    op.drop_index(
+        op.f(f"ix_{table_prefix}organization_subscriptions_stripe_subscription_id"),
+        table_name=f"{table_prefix}organization_subscriptions",
+    )
+    op.drop_index(
+        op.f(f"ix_{table_prefix}users_stripe_customer_id"),
+        table_name=f"{table_prefix}users",
+    )
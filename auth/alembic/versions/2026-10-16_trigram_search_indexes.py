@@ -0,0 +1,58 @@
+"""trigram_search_indexes
+
+Revision ID: 5e0b7d3c9a41
+Revises: c551bd1dc1aa
+Create Date: 2026-10-16 09:12:44.318207
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e0b7d3c9a41"
+down_revision = "c551bd1dc1aa"
+branch_labels = None
+depends_on = None
+
+# Columns searched with ILIKE '%query%' by the paginated endpoints,
+# declared on the models with get_trigram_index
+TRIGRAM_INDEXED_COLUMNS = [
+    ("organizations", "name"),
+    ("organization_invitations", "email"),
+    ("subscriptions", "name"),
+    ("users", "email_lower"),
+]
+
+
+def upgrade():
+    table_prefix = op.get_context().opts["table_prefix"]
+    connection = op.get_bind()
+
+    # Leading-wildcard ILIKE can only use an index through pg_trgm
+    if connection.dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column in TRIGRAM_INDEXED_COLUMNS:
+        op.create_index(
+            op.f(f"ix_{table_prefix}{table}_{column}_trgm"),
+            f"{table_prefix}{table}",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade():
+    table_prefix = op.get_context().opts["table_prefix"]
+    connection = op.get_bind()
+
+    if connection.dialect.name != "postgresql":
+        return
+
+    for table, column in TRIGRAM_INDEXED_COLUMNS:
+        op.drop_index(
+            op.f(f"ix_{table_prefix}{table}_{column}_trgm"),
+            table_name=f"{table_prefix}{table}",
+        )
@@ -3,7 +3,7 @@ import secrets
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from auth import schemas
-from auth.crypto.jwk import generate_jwk
+from auth.crypto.jwk import generate_jwk_async
 from auth.dependencies.admin_authentication import is_authenticated_admin_api
 from auth.dependencies.client import get_client_by_id_or_404, get_paginated_clients
 from auth.dependencies.logger import get_audit_logger
@@ -100,7 +100,7 @@ async def create_encryption_key(
     audit_logger: AuditLogger = Depends(get_audit_logger),
     trigger_webhooks: TriggerWebhooks = Depends(get_trigger_webhooks),
 ):
-    key = generate_jwk(secrets.token_urlsafe(), "enc")
+    key = await generate_jwk_async(secrets.token_urlsafe(), "enc")
     client.encrypt_jwk = key.export_public()
     await repository.update(client)
     audit_logger.log_object_write(AuditLogMessage.OBJECT_UPDATED, client)
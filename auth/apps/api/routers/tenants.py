@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from auth import schemas
+from auth.crypto.jwk import generate_signature_jwk_string_async
 from auth.dependencies.admin_authentication import is_authenticated_admin_api
 from auth.dependencies.logger import get_audit_logger
 from auth.dependencies.pagination import PaginatedObjects
@@ -102,6 +103,7 @@ async def create_tenant(
         slug=slug,
         oauth_providers=oauth_providers,
         default_roles=default_roles,
+        sign_jwk=await generate_signature_jwk_string_async(),
     )
 
     tenant = await repository.create(tenant)
@@ -30,11 +30,11 @@ PF = TypeVar("PF", bound=ProfileFormBase)
 async def get_profile_form_class(
     update_user_fields: list[UserField] = Depends(get_update_user_fields),
 ) -> type[PF]:
-    class ProfileFormFields(BaseForm):
-        pass
-
-    for field in update_user_fields:
-        setattr(ProfileFormFields, field.slug, get_form_field(field))
+    ProfileFormFields = type(
+        "ProfileFormFields",
+        (BaseForm,),
+        {field.slug: get_form_field(field) for field in update_user_fields},
+    )
 
     class ProfileForm(ProfileFormBase):
         fields = FormField(ProfileFormFields, separator=".")
@@ -26,11 +26,11 @@ async def get_register_form_class(
         get_optional_registration_session
     ),
 ) -> type[RF]:
-    class RegisterFormFields(BaseForm):
-        pass
-
-    for field in registration_user_fields:
-        setattr(RegisterFormFields, field.slug, get_form_field(field))
+    RegisterFormFields = type(
+        "RegisterFormFields",
+        (BaseForm,),
+        {field.slug: get_form_field(field) for field in registration_user_fields},
+    )
 
     class RegisterForm(RegisterFormBase):
         fields = FormField(RegisterFormFields, separator=".")
@@ -161,6 +161,9 @@ async def create_organization_checkout_session(
     subscription_tier_repository: SubscriptionTierRepository = Depends(
         get_repository(SubscriptionTierRepository)
     ),
+    organization_member_repository: OrganizationMemberRepository = Depends(
+        get_repository(OrganizationMemberRepository)
+    ),
     organization_subscription_repository: OrganizationSubscriptionRepository = Depends(
         get_repository(OrganizationSubscriptionRepository)
     ),
@@ -198,16 +201,8 @@ async def create_organization_checkout_session(
 
         # If not a primary subscription, check if the organization has at least one active primary subscription
         if subscription_tier.type != SubscriptionTierType.PRIMARY:
-            # Get active primary subscriptions
-            active_subscriptions = (
-                await organization_subscription_repository.get_active_by_organization(
-                    organization.id
-                )
-            )
-
-            has_primary = any(
-                sub.tier.type == SubscriptionTierType.PRIMARY
-                for sub in active_subscriptions
+            has_primary = await organization_subscription_repository.has_active_primary(
+                organization.id
             )
 
             if not has_primary:
@@ -218,8 +213,12 @@ async def create_organization_checkout_session(
 
         # Create a payment customer if one doesn't exist
         if not user.stripe_customer_id:
+            # Use the owner as the email contact
+            owner = await organization_member_repository.get_owner(organization.id)
             user.stripe_customer_id = (
-                await payment_service.create_organization_customer(organization)
+                await payment_service.create_organization_customer(
+                    organization, owner.user.email if owner is not None else None
+                )
             )
             await user_repository.update(user)
 
@@ -268,9 +268,6 @@ async def create_organization_invitation(
     organization_manager: OrganizationManager = Depends(get_organization_manager),
     tenant: Tenant = Depends(get_current_tenant),
     client_repository: ClientRepository = Depends(get_repository(ClientRepository)),
-    organization_subscription_repository: OrganizationSubscriptionRepository = Depends(
-        get_repository(OrganizationSubscriptionRepository)
-    ),
 ):
     """Create invitation - requires invite permission"""
     try:
@@ -281,12 +278,8 @@ async def create_organization_invitation(
             if not str(invitation_create.redirect_uri) in client.redirect_uris:
                 raise InvalidClientRedirectUriError()
 
-        accounts = await organization_subscription_repository.get_organization_accounts(
-            organization.id
-        )
-
         await organization_manager.create_invitation(
-            request, accounts, organization, invitation_create, tenant, client
+            request, organization, invitation_create, tenant, client
         )
     except (
         InvalidInvitationError,
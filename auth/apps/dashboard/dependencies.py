@@ -72,7 +72,7 @@ class DatatableQueryParameters:
         self.params = params
 
     def is_ordered(self, field: str, way: Literal["asc", "desc"] = "asc") -> bool:
-        field_accessor = field.split(".")
+        field_accessor = tuple(field.split("."))
         for ordered_field, is_desc in self.ordering:
             if ordered_field == field_accessor:
                 return (way == "asc" and is_desc is False) or (
@@ -86,7 +86,7 @@ class DatatableQueryParameters:
         )
 
     def toggle_field_ordering(self, field: str) -> "DatatableQueryParameters":
-        field_accessor = field.split(".")
+        field_accessor = tuple(field.split("."))
         if self.is_ordered(field, "asc"):
             updated_ordering = [(field_accessor, True)]
         elif self.is_ordered(field, "desc"):
@@ -140,7 +140,7 @@ class DatatableQueryParametersGetter:
         self.default_columns = default_columns
         self.params = params or []
 
-    def __call__(
+    async def __call__(
         self,
         request: Request,
         pagination: Pagination = Depends(get_pagination),
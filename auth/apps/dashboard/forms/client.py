@@ -7,7 +7,7 @@ from wtforms import (
     validators,
 )
 
-from auth.apps.dashboard.validators import RedirectURLValidator
+from auth.apps.dashboard.validators import RedirectURLValidator, UUIDValidator
 from auth.forms import ComboboxSelectField, CSRFBaseForm
 from auth.models import ClientType
 
@@ -33,7 +33,7 @@ class ClientCreateForm(BaseClientForm):
     tenant = ComboboxSelectField(
         "Tenant",
         query_endpoint_path="/admin/tenants/",
-        validators=[validators.InputRequired(), validators.UUID()],
+        validators=[validators.InputRequired(), UUIDValidator()],
     )
 
 
@@ -1,5 +1,6 @@
 from wtforms import FieldList, SelectField, StringField, validators
 
+from auth.apps.dashboard.validators import URLValidator
 from auth.forms import CSRFBaseForm
 from auth.services.oauth_provider import AvailableOAuthProvider
 
@@ -14,7 +15,7 @@ class BaseOAuthProviderForm(CSRFBaseForm):
     name = StringField("Name")
     openid_configuration_endpoint = StringField(
         "OpenID configuration endpoint",
-        validators=[validators.InputRequired(), validators.URL()],
+        validators=[validators.InputRequired(), URLValidator()],
     )
     client_id = StringField("Client ID", validators=[validators.InputRequired()])
     client_secret = StringField(
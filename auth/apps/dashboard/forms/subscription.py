@@ -1,6 +1,7 @@
 from wtforms import (BooleanField, IntegerField, SelectField, StringField,
                      validators)
 
+from auth.apps.dashboard.validators import UUIDValidator
 from auth.forms import (ComboboxSelectField, ComboboxSelectMultipleField,
                         CSRFBaseForm)
 from auth.models.organization_subscription import SubscriptionStatus
@@ -39,7 +40,7 @@ class SubscriptionCreateForm(BaseSubscriptionForm):
     tenant = ComboboxSelectField(
         "Tenant",
         query_endpoint_path="/admin/tenants/",
-        validators=[validators.InputRequired(), validators.UUID()],
+        validators=[validators.InputRequired(), UUIDValidator()],
     )
 
 
@@ -97,12 +98,12 @@ class OrganizationSubscriptionForm(CSRFBaseForm):
     organization = ComboboxSelectField(
         "Organization",
         query_endpoint_path="/admin/users/organizations/",
-        validators=[validators.InputRequired(), validators.UUID()],
+        validators=[validators.InputRequired(), UUIDValidator()],
     )
     tier = ComboboxSelectField(
         "Subscription Tier",
         query_endpoint_path="/admin/subscriptions/tiers/",
-        validators=[validators.Optional(), validators.UUID()],
+        validators=[validators.Optional(), UUIDValidator()],
     )
     roles = ComboboxSelectMultipleField(
         "Roles",
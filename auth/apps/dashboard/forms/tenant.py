@@ -1,5 +1,6 @@
 from wtforms import BooleanField, EmailField, StringField, URLField, validators
 
+from auth.apps.dashboard.validators import URLValidator, UUIDValidator
 from auth.forms import (
     ComboboxSelectField,
     ComboboxSelectMultipleField,
@@ -13,20 +14,20 @@ class BaseTenantForm(CSRFBaseForm):
     registration_allowed = BooleanField("Registration allowed", default=True)
     logo_url = URLField(
         "Logo URL",
-        validators=[validators.Optional(), validators.URL(require_tld=False)],
+        validators=[validators.Optional(), URLValidator(require_tld=False)],
         filters=[empty_string_to_none],
         description="It will be shown on the top left of authentication pages.",
     )
     application_url = URLField(
         "Application URL",
-        validators=[validators.Optional(), validators.URL(require_tld=False)],
+        validators=[validators.Optional(), URLValidator(require_tld=False)],
         filters=[empty_string_to_none],
         description="URL to your application. Used to show a link going back to your application on the user dashboard.",
     )
     theme = ComboboxSelectField(
         "UI Theme",
         query_endpoint_path="/admin/customization/themes/",
-        validators=[validators.Optional(), validators.UUID()],
+        validators=[validators.Optional(), UUIDValidator()],
         filters=[empty_string_to_none],
         description="If left empty, the default theme will be used.",
     )
@@ -1,5 +1,6 @@
 from wtforms import Form, IntegerField, SelectField, StringField, URLField, validators
 
+from auth.apps.dashboard.validators import URLValidator
 from auth.forms import CSRFBaseForm
 
 
@@ -81,5 +82,5 @@ class ThemeUpdateForm(CSRFBaseForm):
     font_family = StringField("Font family", validators=[validators.InputRequired()])
     font_css_url = URLField(
         "CSS font URL",
-        validators=[validators.Optional(), validators.URL(require_tld=False)],
+        validators=[validators.Optional(), URLValidator(require_tld=False)],
     )
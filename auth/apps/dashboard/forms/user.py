@@ -2,6 +2,7 @@ from wtforms import (BooleanField, EmailField, FieldList, Form, FormField,
                      IntegerField, PasswordField, SelectField, StringField,
                      validators, widgets)
 
+from auth.apps.dashboard.validators import UUIDValidator
 from auth.forms import (ComboboxSelectField, CSRFBaseForm,
                         empty_string_to_none, get_form_field)
 from auth.models import UserField
@@ -22,11 +23,11 @@ class BaseUserForm(CSRFBaseForm):
     async def get_form_class(
         cls, user_fields: list[UserField]
     ) -> type["UserCreateForm"]:
-        class UserFormFields(Form):
-            pass
-
-        for field in user_fields:
-            setattr(UserFormFields, field.slug, get_form_field(field))
+        UserFormFields = type(
+            "UserFormFields",
+            (Form,),
+            {field.slug: get_form_field(field) for field in user_fields},
+        )
 
         class UserForm(cls):  # type: ignore
             fields = FormField(UserFormFields)
@@ -43,7 +44,7 @@ class UserCreateForm(BaseUserForm):
     tenant = ComboboxSelectField(
         "Tenant",
         query_endpoint_path="/admin/tenants/",
-        validators=[validators.InputRequired(), validators.UUID()],
+        validators=[validators.InputRequired(), UUIDValidator()],
     )
 
 
@@ -60,7 +61,7 @@ class UserAccessTokenForm(CSRFBaseForm):
         "Client",
         description="The access token will be tied to this client.",
         query_endpoint_path="/admin/clients/",
-        validators=[validators.InputRequired(), validators.UUID()],
+        validators=[validators.InputRequired(), UUIDValidator()],
     )
     scopes = FieldList(
         StringField(validators=[validators.InputRequired()]),
@@ -73,7 +74,7 @@ class CreateUserPermissionForm(CSRFBaseForm):
     permission = ComboboxSelectField(
         "Add new permission",
         query_endpoint_path="/admin/access-control/permissions/",
-        validators=[validators.InputRequired(), validators.UUID()],
+        validators=[validators.InputRequired(), UUIDValidator()],
     )
 
 
@@ -81,7 +82,7 @@ class CreateUserRoleForm(CSRFBaseForm):
     role = ComboboxSelectField(
         "Add new role",
         query_endpoint_path="/admin/access-control/roles/",
-        validators=[validators.InputRequired(), validators.UUID()],
+        validators=[validators.InputRequired(), UUIDValidator()],
     )
 
 
@@ -89,12 +90,12 @@ class OrganizationSubscriptionForm(CSRFBaseForm):
     organization = ComboboxSelectField(
         "Organization",
         query_endpoint_path="/admin/users/organizations/",
-        validators=[validators.InputRequired(), validators.UUID()],
+        validators=[validators.InputRequired(), UUIDValidator()],
     )
     tier = ComboboxSelectField(
         "Subscription Tier",
         query_endpoint_path="/admin/subscriptions/tiers/",
-        validators=[validators.InputRequired(), validators.UUID()],
+        validators=[validators.InputRequired(), UUIDValidator()],
     )
     status = SelectField(
         "Status",
@@ -1,5 +1,6 @@
 from wtforms import URLField, validators
 
+from auth.apps.dashboard.validators import URLValidator
 from auth.forms import CSRFBaseForm, SelectMultipleFieldCheckbox
 from auth.services.webhooks.models import WEBHOOK_EVENTS
 
@@ -7,7 +8,7 @@ from auth.services.webhooks.models import WEBHOOK_EVENTS
 class BaseWebhookForm(CSRFBaseForm):
     url = URLField(
         "URL",
-        validators=[validators.InputRequired(), validators.URL(require_tld=False)],
+        validators=[validators.InputRequired(), URLValidator(require_tld=False)],
     )
     events = SelectMultipleFieldCheckbox(
         "Events to notify", choices=[event.key() for event in WEBHOOK_EVENTS]
@@ -24,16 +24,7 @@
 #     context: BaseContext = Depends(get_base_context),
 #     hx_combobox: bool = Header(False),
 # ):
-#     # Get all active prices
-#     organizations = await organization_repository.all()
-
-#     # Filter by query if provided
-#     if query:
-#         organizations = [
-#             organization
-#             for organization in organizations
-#             if query.lower() in organization.name.lower()
-#         ]
+#     organizations = await organization_repository.search(query)
 
 #     if hx_combobox:
 #         return templates.TemplateResponse(
@@ -1,6 +1,7 @@
+import asyncio
+import uuid
+
 from fastapi import APIRouter, Depends, Header, Request, status
-from fastapi.exceptions import HTTPException
-from pydantic import UUID4
 
 from auth.apps.dashboard.dependencies import (
     BaseContext,
@@ -23,10 +24,11 @@ from auth.dependencies.repositories import get_repository
 from auth.dependencies.subscription import (
     get_paginated_subscriptions,
     get_subscription_by_id_or_404,
+    get_subscription_tier_by_id_or_404,
 )
-from auth.dependencies.tenant import get_tenants
+from auth.dependencies.tenant import get_list_tenants
 from auth.forms import FormHelper
-from auth.models import Tenant
+from auth.models import Role, Tenant
 from auth.models.subscription import (
     Subscription,
     SubscriptionInterval,
@@ -34,6 +36,9 @@ from auth.models.subscription import (
     SubscriptionTierMode,
     SubscriptionTierType,
 )
+from auth.repositories.organization_subscription import (
+    OrganizationSubscriptionRepository,
+)
 from auth.repositories.role import RoleRepository
 from auth.repositories.subscription import (
     SubscriptionRepository,
@@ -46,24 +51,46 @@ from auth.templates import templates
 router = APIRouter(dependencies=[Depends(is_authenticated_admin_session)])
 
 
+COLUMNS = [
+    DatatableColumn("Name", "name", "name_column", ordering="name"),
+    DatatableColumn(
+        "Public",
+        "is_public",
+        "is_public_column",
+        ordering="is_public",
+    ),
+    DatatableColumn(
+        "Accounts",
+        "accounts",
+        "accounts_column",
+        ordering="accounts",
+    ),
+    DatatableColumn("Tiers", "tiers", "tiers_column"),
+    DatatableColumn("Tenant", "tenant", "tenant_column", ordering="tenant.name"),
+]
+
+
+get_datatable_query_parameters = DatatableQueryParametersGetter(
+    ["name", "is_public", "accounts", "tenant"], ["tenant", "query"]
+)
+
+
+def get_unknown_role_ids(role_ids: list[str], roles: list[Role]) -> list[str]:
+    found_ids = {role.id for role in roles}
+    unknown_role_ids: set[str] = set()
+    for role_id in role_ids:
+        # Compare UUID values, so that any spelling of a found role id matches it
+        try:
+            if uuid.UUID(str(role_id)) in found_ids:
+                continue
+        except ValueError:
+            pass
+        unknown_role_ids.add(str(role_id))
+    return sorted(unknown_role_ids)
+
+
 async def get_columns() -> list[DatatableColumn]:
-    return [
-        DatatableColumn("Name", "name", "name_column", ordering="name"),
-        DatatableColumn(
-            "Public",
-            "is_public",
-            "is_public_column",
-            ordering="is_public",
-        ),
-        DatatableColumn(
-            "Accounts",
-            "accounts",
-            "accounts_column",
-            ordering="accounts",
-        ),
-        DatatableColumn("Tiers", "tiers", "tiers_column"),
-        DatatableColumn("Tenant", "tenant", "tenant_column", ordering="tenant.name"),
-    ]
+    return COLUMNS
 
 
 async def get_list_template(hx_combobox: bool = Header(False)) -> str:
@@ -75,20 +102,12 @@ async def get_list_template(hx_combobox: bool = Header(False)) -> str:
 async def get_list_context(
     columns: list[DatatableColumn] = Depends(get_columns),
     datatable_query_parameters: DatatableQueryParameters = Depends(
-        DatatableQueryParametersGetter(
-            [
-                "name",
-                "is_public",
-                "accounts",
-                "tenant",
-            ],
-            ["tenant", "query"],
-        )
+        get_datatable_query_parameters
     ),
     paginated_subscriptions: PaginatedObjects[Subscription] = Depends(
         get_paginated_subscriptions
     ),
-    tenants: list[Tenant] = Depends(get_tenants),
+    tenants: list[Tenant] = Depends(get_list_tenants),
 ):
     subscriptions, count = paginated_subscriptions
     return {
@@ -157,11 +176,16 @@ async def create_subscription(
     if await form_helper.is_submitted_and_valid():
         form = await form_helper.get_form()
 
-        # Check if Stripe product ID exists
-        stripe_product_id = form.stripe_product_id.data
-        # Verify the product exists in Stripe
-        stripe_product = await payment_service.get_product_from_stripe(
-            stripe_product_id
+        # Queries share the session: run them one after the other,
+        # alongside the Stripe product lookup
+        async def get_roles_and_tenant() -> tuple[list[Role], Tenant | None]:
+            roles = await role_repository.get_by_ids(form.roles.data)
+            tenant = await tenant_repository.get_by_id(form.tenant.data)
+            return roles, tenant
+
+        stripe_product, (roles, tenant) = await asyncio.gather(
+            payment_service.get_product_from_stripe(form.stripe_product_id.data),
+            get_roles_and_tenant(),
         )
 
         if not stripe_product:
@@ -175,19 +199,14 @@ async def create_subscription(
 
         subscription = Subscription()
 
-        # Get roles
-        roles = []
-        for role_id in form.roles.data:
-            role = await role_repository.get_by_id(role_id)
-            if role is None:
-                form.roles.errors.append("Unknown role.")
-                return await form_helper.get_error_response(
-                    "Unknown role.", "unknown_role"
-                )
-            roles.append(role)
+        unknown_roles = get_unknown_role_ids(form.roles.data, roles)
+        if unknown_roles:
+            form.roles.errors.append(f"Unknown roles: {', '.join(unknown_roles)}.")
+            return await form_helper.get_error_response(
+                "Unknown role.", "unknown_role"
+            )
         form.roles.data = roles
 
-        tenant = await tenant_repository.get_by_id(form.tenant.data)
         if tenant is None:
             form.tenant.errors.append("Unknown tenant.")
             return await form_helper.get_error_response(
@@ -233,19 +252,20 @@ async def update_subscription(
     )
 
     form = await form_helper.get_form()
-    form.roles.choices = [(role.id, role.display_name) for role in subscription.roles]
+    # Choices only back the pre-selected roles; submitted data are plain ids
+    if request.method == "GET":
+        form.roles.choices = [
+            (role.id, role.display_name) for role in subscription.roles
+        ]
 
     if await form_helper.is_submitted_and_valid():
-        # Check if Stripe product ID exists if changed
+        # Verify the product exists in Stripe if changed, while we look up roles
         stripe_product_id = form.stripe_product_id.data
-        product_id_changed = stripe_product_id != subscription.stripe_product_id
-
-        if product_id_changed:
-            # Verify the product exists in Stripe
-            stripe_product = await payment_service.get_product_from_stripe(
-                stripe_product_id
+        if stripe_product_id != subscription.stripe_product_id:
+            stripe_product, roles = await asyncio.gather(
+                payment_service.get_product_from_stripe(stripe_product_id),
+                role_repository.get_by_ids(form.roles.data),
             )
-
             if not stripe_product:
                 form.stripe_product_id.errors.append(
                     "Product not found in payment provider."
@@ -254,17 +274,16 @@ async def update_subscription(
                     "Product not found in payment provider.",
                     "product_not_found",
                 )
+        else:
+            roles = await role_repository.get_by_ids(form.roles.data)
 
-        # Get roles
-        subscription.roles = []
-        for role_id in form.roles.data:
-            role = await role_repository.get_by_id(role_id)
-            if role is None:
-                form.roles.errors.append("Unknown role.")
-                return await form_helper.get_error_response(
-                    "Unknown role.", "unknown_role"
-                )
-            subscription.roles.append(role)
+        unknown_roles = get_unknown_role_ids(form.roles.data, roles)
+        if unknown_roles:
+            form.roles.errors.append(f"Unknown roles: {', '.join(unknown_roles)}.")
+            return await form_helper.get_error_response(
+                "Unknown role.", "unknown_role"
+            )
+        subscription.roles = roles
 
         # Remove roles from form data before populating object
         del form.roles
@@ -290,7 +309,9 @@ async def delete_subscription(
     repository: SubscriptionRepository = Depends(
         get_repository(SubscriptionRepository)
     ),
-    # organization_subscription_repository: OrganizationSubscriptionRepository
+    organization_subscription_repository: OrganizationSubscriptionRepository = Depends(
+        get_repository(OrganizationSubscriptionRepository)
+    ),
     list_context=Depends(get_list_context),
     context: BaseContext = Depends(get_base_context),
 ):
@@ -302,9 +323,10 @@ async def delete_subscription(
             status_code=status.HTTP_204_NO_CONTENT,
         )
     else:
-        # Count active organization subscriptions
         active_subscriptions_count = (
-            0  # In a real implementation, this would be counted
+            await organization_subscription_repository.count_by_subscription(
+                subscription.id
+            )
         )
 
         return templates.TemplateResponse(
@@ -421,8 +443,7 @@ async def create_subscription_tier(
 )
 async def edit_subscription_tier(
     request: Request,
-    tier_id: UUID4,
-    subscription: Subscription = Depends(get_subscription_by_id_or_404),
+    tier: SubscriptionTier = Depends(get_subscription_tier_by_id_or_404),
     tier_repository: SubscriptionTierRepository = Depends(
         get_repository(SubscriptionTierRepository)
     ),
@@ -430,13 +451,7 @@ async def edit_subscription_tier(
     list_context=Depends(get_list_context),
     context: BaseContext = Depends(get_base_context),
 ):
-    # Get the tier
-    tier = await tier_repository.get_by_id(tier_id)
-    if not tier or tier.subscription_id != subscription.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Tier with id {tier_id} not found for this subscription",
-        )
+    subscription = tier.subscription
 
     form_helper = FormHelper(
         SubscriptionTierForm,
@@ -491,7 +506,6 @@ async def edit_subscription_tier(
                 return await form_helper.get_error_response(
                     "Price not found for this subscription.", "price_not_found"
                 )
-        print(form.data)
         form.populate_obj(tier)
         await tier_repository.update(tier)
 
@@ -509,21 +523,17 @@ async def edit_subscription_tier(
 )
 async def delete_subscription_tier(
     request: Request,
-    tier_id: UUID4,
-    subscription: Subscription = Depends(get_subscription_by_id_or_404),
+    tier: SubscriptionTier = Depends(get_subscription_tier_by_id_or_404),
     tier_repository: SubscriptionTierRepository = Depends(
         get_repository(SubscriptionTierRepository)
     ),
+    organization_subscription_repository: OrganizationSubscriptionRepository = Depends(
+        get_repository(OrganizationSubscriptionRepository)
+    ),
     list_context=Depends(get_list_context),
     context: BaseContext = Depends(get_base_context),
 ):
-    # Get the tier
-    tier = await tier_repository.get_by_id(tier_id)
-    if not tier or tier.subscription_id != subscription.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Tier with id {tier_id} not found for this subscription",
-        )
+    subscription = tier.subscription
 
     if request.method == "DELETE":
         await tier_repository.delete(tier)
@@ -533,9 +543,8 @@ async def delete_subscription_tier(
             status_code=status.HTTP_204_NO_CONTENT,
         )
     else:
-        # Count active organization subscriptions using this tier
         active_subscriptions_count = (
-            0  # In a real implementation, this would be counted
+            await organization_subscription_repository.count_active_by_tier(tier.id)
         )
 
         return templates.TemplateResponse(
@@ -559,31 +568,9 @@ async def list_subscription_tiers_combobox(
         get_repository(SubscriptionTierRepository)
     ),
     context: BaseContext = Depends(get_base_context),
-    hx_combobox: bool = Header(False),
 ):
-    # Get all tiers
-    tiers = await tier_repository.get_all_with_subscription()
-
-    # Filter by query if provided
-    if query:
-        tiers = [
-            tier
-            for tier in tiers
-            if query.lower() in tier.name.lower()
-            or (tier.subscription and query.lower() in tier.subscription.name.lower())
-        ]
-
-    if hx_combobox:
-        return templates.TemplateResponse(
-            request,
-            "admin/subscriptions/tiers/list_combobox.html",
-            {
-                **context,
-                "tiers": tiers,
-            },
-        )
+    tiers = await tier_repository.search(query)
 
-    # For now, just return the combobox view
     return templates.TemplateResponse(
         request,
         "admin/subscriptions/tiers/list_combobox.html",
@@ -10,6 +10,7 @@ from auth.apps.dashboard.forms.tenant import (TenantCreateForm,
                                               TenantEmailForm,
                                               TenantUpdateForm)
 from auth.apps.dashboard.responses import HXRedirectResponse
+from auth.crypto.jwk import generate_signature_jwk_string_async
 from auth.dependencies.admin_authentication import \
     is_authenticated_admin_session
 from auth.dependencies.email_provider import get_email_provider
@@ -275,6 +276,7 @@ async def create_tenant(
 
         form.populate_obj(tenant)
         tenant.slug = await repository.get_available_slug(tenant.name)
+        tenant.sign_jwk = await generate_signature_jwk_string_async()
         tenant = await repository.create(tenant)
         audit_logger.log_object_write(AuditLogMessage.OBJECT_CREATED, tenant)
         trigger_webhooks(TenantCreated, tenant, schemas.tenant.Tenant)
@@ -1,6 +1,6 @@
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import UUID4
 
 from auth import schemas
@@ -803,30 +803,9 @@ async def list_organizations(
         get_repository(OrganizationRepository)
     ),
     context: BaseContext = Depends(get_base_context),
-    hx_combobox: bool = Header(False),
 ):
-    # Get all active prices
-    organizations = await organization_repository.all()
-
-    # Filter by query if provided
-    if query:
-        organizations = [
-            organization
-            for organization in organizations
-            if query.lower() in organization.name.lower()
-        ]
-
-    if hx_combobox:
-        return templates.TemplateResponse(
-            request,
-            "admin/organizations/list_combobox.html",
-            {
-                **context,
-                "organizations": organizations,
-            },
-        )
+    organizations = await organization_repository.search(query)
 
-    # For now, just return the combobox view
     return templates.TemplateResponse(
         request,
         "admin/organizations/list_combobox.html",
@@ -11,6 +11,51 @@ class NotHTTPSURLValidationError(validators.ValidationError):
         super().__init__("An HTTPS URL is required.")
 
 
+UUID_REGEX = re.compile(
+    r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+
+class UUIDValidator:
+    """
+    Validates that the field contains a UUID.
+
+    Same contract as `wtforms.validators.UUID`, but matches a single compiled
+    regex instead of building a `uuid.UUID` object we would throw away.
+    """
+
+    def __init__(self, message=None):
+        self.message = message
+
+    def __call__(self, form, field):
+        if not isinstance(field.data, str) or UUID_REGEX.match(field.data) is None:
+            message = self.message
+            if message is None:
+                message = field.gettext("Invalid UUID.")
+            raise validators.ValidationError(message)
+
+
+URL_PREFIX_REGEX = re.compile(r"^[a-z]+://[^\/\?:]", re.IGNORECASE)
+
+
+class URLValidator(validators.URL):
+    """
+    `wtforms.validators.URL` with a cheap prefix pre-check.
+
+    Values that can't possibly be a URL (no scheme or no host) are rejected
+    before running the full, backtracking URL regex and hostname validation.
+    """
+
+    def __call__(self, form, field):
+        if URL_PREFIX_REGEX.match(field.data or "") is None:
+            message = self.message
+            if message is None:
+                message = field.gettext("Invalid URL.")
+            raise validators.ValidationError(message)
+        super().__call__(form, field)
+
+
 class RedirectURLValidator(validators.Regexp):
     def __init__(self, message=None):
         regex = (
@@ -1,5 +1,6 @@
 import json
-from datetime import UTC, datetime
+import time
+from datetime import datetime
 from typing import Any
 
 from jwcrypto import jwk, jwt
@@ -24,7 +25,7 @@ def generate_access_token(
     permissions: list[str],
     lifetime_seconds: int,
 ) -> str:
-    iat = int(datetime.now(UTC).timestamp())
+    iat = int(time.time())
     exp = iat + lifetime_seconds
 
     claims = {
@@ -1,12 +1,15 @@
-import base64
+import binascii
 import hashlib
-from datetime import UTC, datetime
+import time
+from datetime import datetime
 
 from jwcrypto import jwk, jwt
 
 from auth.models import Client, User
 from auth.services.acr import ACR
 
+URLSAFE_BASE64_TRANSLATION = bytes.maketrans(b"+/", b"-_")
+
 
 def generate_id_token(
     signing_key: jwk.JWK,
@@ -40,7 +43,7 @@ def generate_id_token(
     :encryption_key: Optional JWK to further encrypt the signed token.
     In this case, it becomes a Nested JWT, as defined in rfc7519.
     """
-    iat = int(datetime.now(UTC).timestamp())
+    iat = int(time.time())
     exp = iat + lifetime_seconds
 
     claims = {
@@ -87,12 +90,12 @@ def get_validation_hash(value: str) -> str:
 
     Specification: https://openid.net/specs/openid-connect-core-1_0.html#toc
     """
-    hasher = hashlib.sha256()
-    hasher.update(value.encode("utf-8"))
-    hash = hasher.digest()
+    hash = hashlib.sha256(value.encode("utf-8")).digest()
 
-    half_hash = hash[0 : int(len(hash) / 2)]
-    # Remove the Base64 padding "==" at the end
-    base64_hash = base64.urlsafe_b64encode(half_hash)[:-2]
+    half_hash = hash[: len(hash) // 2]
+    # URL-safe Base64, without the padding "==" at the end
+    base64_hash = binascii.b2a_base64(half_hash, newline=False).translate(
+        URLSAFE_BASE64_TRANSLATION
+    )[:-2]
 
-    return base64_hash.decode("utf-8")
+    return base64_hash.decode("ascii")
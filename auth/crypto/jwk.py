@@ -1,6 +1,7 @@
 import secrets
 from typing import Literal
 
+from fastapi.concurrency import run_in_threadpool
 from jwcrypto import jwk
 
 from auth.settings import settings
@@ -20,6 +21,16 @@ def generate_jwk(kid: str, use: Literal["sig", "enc"]) -> jwk.JWK:
     )
 
 
+async def generate_jwk_async(kid: str, use: Literal["sig", "enc"]) -> jwk.JWK:
+    """
+    Generate a JWK in the threadpool.
+
+    RSA key generation takes up to seconds and releases the GIL,
+    so it shouldn't run on the event loop.
+    """
+    return await run_in_threadpool(generate_jwk, kid, use)
+
+
 def load_jwk(json: str) -> jwk.JWK:
     return jwk.JWK.from_json(json)
 
@@ -27,3 +38,8 @@ def load_jwk(json: str) -> jwk.JWK:
 def generate_signature_jwk_string() -> str:
     key = generate_jwk(secrets.token_urlsafe(), "sig")
     return key.export()
+
+
+async def generate_signature_jwk_string_async() -> str:
+    key = await generate_jwk_async(secrets.token_urlsafe(), "sig")
+    return key.export()
@@ -5,13 +5,13 @@ from sqlalchemy import select
 
 from auth.crypto.token import get_token_hash
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
 from auth.models import AdminAPIKey
 from auth.repositories import AdminAPIKeyRepository
@@ -34,10 +34,11 @@ async def get_paginated_api_keys(
     pagination: Pagination = Depends(get_pagination),
     ordering: Ordering = Depends(OrderingGetter()),
     repository: AdminAPIKeyRepository = Depends(AdminAPIKeyRepository),
-    get_paginated_objects: GetPaginatedObjects[AdminAPIKey] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[AdminAPIKey]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(AdminAPIKey)
     return await get_paginated_objects(statement, pagination, ordering, repository)
 
@@ -6,6 +6,7 @@ from auth.dependencies.permission import (
     UserPermissionsGetter,
     get_user_permissions_getter,
 )
+from auth.dependencies.repositories import get_repository
 from auth.models import AdminAPIKey, AdminSessionToken
 from auth.repositories import UserRepository
 from auth.services.admin import ADMIN_PERMISSION_CODENAME
@@ -14,7 +15,7 @@ from auth.services.admin import ADMIN_PERMISSION_CODENAME
 async def is_authenticated_admin_session(
     request: Request,
     session_token: AdminSessionToken = Depends(get_admin_session_token),
-    user_repository: UserRepository = Depends(UserRepository),
+    user_repository: UserRepository = Depends(get_repository(UserRepository)),
     get_user_permissions: UserPermissionsGetter = Depends(get_user_permissions_getter),
 ):
     user = await user_repository.get_by_id(session_token.user_id)
@@ -3,13 +3,13 @@ from pydantic import UUID4
 from sqlalchemy import select
 
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
 from auth.models import Client
 from auth.repositories import ClientRepository
@@ -21,10 +21,11 @@ async def get_paginated_clients(
     pagination: Pagination = Depends(get_pagination),
     ordering: Ordering = Depends(OrderingGetter()),
     repository: ClientRepository = Depends(ClientRepository),
-    get_paginated_objects: GetPaginatedObjects[Client] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[Client]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(Client)
 
     if query is not None:
@@ -3,13 +3,13 @@ from pydantic import UUID4
 from sqlalchemy import select
 
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
 from auth.dependencies.repositories import get_repository
 from auth.models import EmailTemplate
@@ -22,10 +22,11 @@ async def get_paginated_email_templates(
     repository: EmailTemplateRepository = Depends(
         get_repository(EmailTemplateRepository)
     ),
-    get_paginated_objects: GetPaginatedObjects[EmailTemplate] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[EmailTemplate]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(EmailTemplate)
     return await get_paginated_objects(statement, pagination, ordering, repository)
 
@@ -3,13 +3,13 @@ from pydantic import UUID4
 from sqlalchemy import or_, select
 
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
 from auth.dependencies.repositories import get_repository
 from auth.dependencies.tenant import get_current_tenant
@@ -24,10 +24,11 @@ async def get_paginated_oauth_providers(
     repository: OAuthProviderRepository = Depends(
         get_repository(OAuthProviderRepository)
     ),
-    get_paginated_objects: GetPaginatedObjects[OAuthProvider] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[OAuthProvider]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(OAuthProvider)
 
     if query is not None:
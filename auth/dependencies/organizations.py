@@ -1,18 +1,18 @@
+import functools
 from typing import Any
 
 from fastapi import Depends, HTTPException, Query, status
 from fastapi.exceptions import RequestValidationError
-from pydantic import UUID4, ValidationError, create_model
+from pydantic import UUID4, BaseModel, ValidationError, create_model
 from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager
 
 from auth import schemas
 from auth.dependencies.logger import get_audit_logger
-from auth.dependencies.pagination import (GetPaginatedObjects, Ordering,
-                                          OrderingGetter, PaginatedObjects,
-                                          Pagination,
-                                          get_paginated_objects_getter,
-                                          get_pagination)
+from auth.dependencies.pagination import (Ordering, OrderingGetter,
+                                          PaginatedObjects, Pagination,
+                                          get_paginated_objects,
+                                          get_pagination, get_should_paginate)
 from auth.dependencies.repositories import get_repository
 from auth.dependencies.request import get_request_json
 from auth.dependencies.tasks import get_send_task
@@ -66,18 +66,15 @@ async def get_paginated_organizations(
     repository: OrganizationRepository = Depends(
         get_repository(OrganizationRepository)
     ),
-    get_paginated_objects: GetPaginatedObjects[Organization] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[Organization]:
-    # Base query for organizations
-    statement = select(Organization)
+    if not should_paginate:
+        return [], 0
 
-    # Get organizations where user is a member
-    member_orgs = select(OrganizationMember.organization_id).where(
-        OrganizationMember.user_id == str(current_user.id)
+    # Organizations where user is a member, as a correlated EXISTS
+    statement = select(Organization).where(
+        Organization.members.any(OrganizationMember.user_id == current_user.id)
     )
-    statement = statement.where(Organization.id.in_(member_orgs))
 
     # Apply name search filter if provided
     if query is not None:
@@ -113,19 +110,19 @@ async def get_paginated_organization_members(
     member_repository: OrganizationMemberRepository = Depends(
         get_repository(OrganizationMemberRepository)
     ),
-    get_paginated_objects: GetPaginatedObjects[OrganizationMember] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[OrganizationMember]:
+    if not should_paginate:
+        return [], 0
+
     statement = (
         select(OrganizationMember)
-        .options(joinedload(OrganizationMember.user))
-        .where(OrganizationMember.organization_id == str(id))
+        .join(OrganizationMember.user)
+        .options(contains_eager(OrganizationMember.user))
+        .where(OrganizationMember.organization_id == id)
     )
     if query is not None:
-        statement = statement.where(
-            OrganizationMember.user.has(name__ilike=f"%{query}%")
-        )
+        statement = statement.where(User.email.ilike(f"%{query}%"))
     return await get_paginated_objects(
         statement, pagination, ordering, member_repository
     )
@@ -139,7 +136,7 @@ async def get_organization_member_by_id_or_404(
     ),
 ) -> OrganizationMember:
     member = await member_repository.get_by_user_and_org(
-        str(user_id), str(organization_id)
+        user_id, organization_id
     )
     if member is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
@@ -155,10 +152,11 @@ async def get_paginated_organization_invitations(
     invitation_repository: OrganizationInvitationRepository = Depends(
         get_repository(OrganizationInvitationRepository)
     ),
-    get_paginated_objects: GetPaginatedObjects[OrganizationInvitation] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[OrganizationInvitation]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(OrganizationInvitation).where(
         OrganizationInvitation.organization_id == organization.id
     )
@@ -181,6 +179,12 @@ async def get_organization_invitation_by_id_or_404(
     return invitation
 
 
+@functools.cache
+def get_organization_body_model(model: type[BaseModel]) -> type[BaseModel]:
+    # Wrapping in "body" gives errors the same loc as FastAPI's body validation
+    return create_model("OrganizationBody", body=(model, ...))
+
+
 async def validate_organization_data(
     json: dict[str, Any] = Depends(get_request_json),
     model: type[
@@ -188,10 +192,7 @@ async def validate_organization_data(
         | schemas.organization.OrganizationUpdate
     ] = None,
 ) -> schemas.organization.OrganizationCreate | schemas.organization.OrganizationUpdate:
-    body_model = create_model(
-        "OrganizationBody",
-        body=(model, ...),
-    )
+    body_model = get_organization_body_model(model)
     try:
         validated_data = body_model(body=json)
     except ValidationError as e:
@@ -206,19 +207,9 @@ async def check_organization_permission(
     organization_manager: OrganizationManager,
 ) -> bool:
     """Check if user has specific organization permission"""
-    organization_member = (
-        await organization_manager.member_repository.get_by_user_and_org(
-            str(user_id), str(organization.id)
-        )
+    return await organization_manager.member_repository.has_permission(
+        user_id, organization.id, permission_codename
     )
-    if organization_member:
-        if organization_member.is_owner_or_admin:
-            return True
-        elif organization_member.is_member:
-            if permission_codename in organization_member.permissions_codenames:
-                return True
-
-    return False
 
 
 def require_organization_permission(
@@ -1,4 +1,4 @@
-from collections.abc import Callable, Coroutine
+import functools
 
 from fastapi import Depends, Header, Query
 from sqlalchemy.sql import Select
@@ -6,13 +6,10 @@ from sqlalchemy.sql import Select
 from auth.repositories.base import BaseRepository, M
 
 RawOrdering = list[str]
-Ordering = list[tuple[list[str], bool]]
+OrderingField = tuple[tuple[str, ...], bool]
+Ordering = list[OrderingField]
 Pagination = tuple[int, int]
 PaginatedObjects = tuple[list[M], int]
-GetPaginatedObjects = Callable[
-    [Select, Pagination, Ordering, BaseRepository[M]],
-    Coroutine[None, None, PaginatedObjects[M]],
-]
 
 
 async def get_paginated_objects(
@@ -26,21 +23,12 @@ async def get_paginated_objects(
     return await repository.paginate(statement, limit, skip)
 
 
-async def get_paginated_objects_noop(
-    statement: Select,
-    pagination: Pagination,
-    ordering: Ordering,
-    repository: BaseRepository[M],
-) -> PaginatedObjects[M]:
-    return ([], 0)
-
-
-async def get_paginated_objects_getter(
+async def get_should_paginate(
     hx_target: str | None = Header(None, include_in_schema=False),
-) -> GetPaginatedObjects[M]:
-    if hx_target == "aside-content":
-        return get_paginated_objects_noop
-    return get_paginated_objects
+) -> bool:
+    # Partial HTMX renders of the aside or the modal don't display the list,
+    # so there is no need to even build the statement
+    return hx_target not in {"aside", "modal"}
 
 
 async def get_pagination(
@@ -53,6 +41,17 @@ async def get_raw_ordering(ordering: str = Query(None)) -> RawOrdering:
     return ordering.split(",") if ordering else []
 
 
+@functools.lru_cache(maxsize=512)
+def parse_ordering(raw_ordering: tuple[str, ...]) -> tuple[OrderingField, ...]:
+    ordering_fields = []
+    for field in raw_ordering:
+        is_desc = field.startswith("-")
+        if is_desc:
+            field = field[1:]
+        ordering_fields.append((tuple(field.split(".")), is_desc))
+    return tuple(ordering_fields)
+
+
 class OrderingGetter:
     def __init__(self, default: Ordering | None = None) -> None:
         self.default = default if default else []
@@ -61,15 +60,9 @@ class OrderingGetter:
         self,
         raw_ordering: RawOrdering = Depends(get_raw_ordering),
     ) -> Ordering:
-        ordering_fields = []
-        for field in raw_ordering:
-            is_desc = False
-            if field.startswith("-"):
-                is_desc = True
-                field = field[1:]
-            ordering_fields.append((field.split("."), is_desc))
+        ordering_fields = parse_ordering(tuple(raw_ordering))
 
         if len(ordering_fields) == 0:
             return self.default
 
-        return ordering_fields
+        return list(ordering_fields)
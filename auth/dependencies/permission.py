@@ -6,14 +6,15 @@ from pydantic import UUID4
 from sqlalchemy import select
 
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
+from auth.dependencies.repositories import get_repository
 from auth.models import Permission, User
 from auth.repositories import PermissionRepository
 
@@ -23,10 +24,11 @@ async def get_paginated_permissions(
     pagination: Pagination = Depends(get_pagination),
     ordering: Ordering = Depends(OrderingGetter()),
     repository: PermissionRepository = Depends(PermissionRepository),
-    get_paginated_objects: GetPaginatedObjects[Permission] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[Permission]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(Permission)
 
     if query is not None:
@@ -54,7 +56,7 @@ UserPermissionsGetter = Callable[[User], Coroutine[Any, Any, list[str]]]
 
 
 async def get_user_permissions_getter(
-    repository: PermissionRepository = Depends(PermissionRepository),
+    repository: PermissionRepository = Depends(get_repository(PermissionRepository)),
 ) -> UserPermissionsGetter:
     async def _get_user_permissions(user: User) -> list[str]:
         permissions = await repository.list(
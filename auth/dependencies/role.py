@@ -3,13 +3,13 @@ from pydantic import UUID4
 from sqlalchemy import select
 
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
 from auth.models import Role
 from auth.repositories import RoleRepository
@@ -20,10 +20,11 @@ async def get_paginated_roles(
     pagination: Pagination = Depends(get_pagination),
     ordering: Ordering = Depends(OrderingGetter()),
     repository: RoleRepository = Depends(RoleRepository),
-    get_paginated_objects: GetPaginatedObjects[Role] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[Role]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(Role)
 
     if query is not None:
@@ -1,12 +1,12 @@
 from fastapi import Depends, HTTPException, Query, status
 from pydantic import UUID4
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
-from auth.dependencies.pagination import (GetPaginatedObjects, Ordering,
-                                          OrderingGetter, PaginatedObjects,
-                                          Pagination,
-                                          get_paginated_objects_getter,
-                                          get_pagination)
+from auth.dependencies.pagination import (Ordering, OrderingGetter,
+                                          PaginatedObjects, Pagination,
+                                          get_paginated_objects,
+                                          get_pagination, get_should_paginate)
 from auth.dependencies.repositories import get_repository
 from auth.models.subscription import Subscription, SubscriptionTier
 from auth.repositories.subscription import (SubscriptionRepository,
@@ -19,7 +19,9 @@ async def get_subscription_by_id_or_404(
         get_repository(SubscriptionRepository)
     ),
 ) -> Subscription:
-    subscription = await repository.get_by_id(id)
+    subscription = await repository.get_by_id(
+        id, (selectinload(Subscription.roles), selectinload(Subscription.tenant))
+    )
     if subscription is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -43,6 +45,22 @@ async def get_tier_by_id_or_404(
     return tier
 
 
+async def get_subscription_tier_by_id_or_404(
+    id: UUID4,
+    tier_id: UUID4,
+    repository: SubscriptionTierRepository = Depends(
+        get_repository(SubscriptionTierRepository)
+    ),
+) -> SubscriptionTier:
+    tier = await repository.get_by_id_and_subscription(tier_id, id)
+    if tier is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tier with id {tier_id} not found for this subscription",
+        )
+    return tier
+
+
 async def get_paginated_subscriptions(
     query: str | None = Query(None),
     tenant: UUID4 | None = Query(None),
@@ -51,11 +69,14 @@ async def get_paginated_subscriptions(
     repository: SubscriptionRepository = Depends(
         get_repository(SubscriptionRepository)
     ),
-    get_paginated_objects: GetPaginatedObjects[Subscription] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[Subscription]:
-    statement = select(Subscription)
+    if not should_paginate:
+        return [], 0
+
+    statement = select(Subscription).options(
+        selectinload(Subscription.tenant), selectinload(Subscription.tiers)
+    )
     if query:
         statement = statement.where(Subscription.name.ilike(f"%{query}%"))
     if tenant is not None:
@@ -4,14 +4,15 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
+from auth.dependencies.repositories import get_repository
 from auth.models import Tenant
 from auth.repositories import TenantRepository
 
@@ -37,10 +38,11 @@ async def get_paginated_tenants(
     pagination: Pagination = Depends(get_pagination),
     ordering: Ordering = Depends(OrderingGetter()),
     repository: TenantRepository = Depends(TenantRepository),
-    get_paginated_objects: GetPaginatedObjects[Tenant] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[Tenant]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(Tenant)
 
     if query is not None:
@@ -67,3 +69,13 @@ async def get_tenants(
     repository: TenantRepository = Depends(TenantRepository),
 ) -> list[Tenant]:
     return await repository.all()
+
+
+async def get_list_tenants(
+    should_paginate: bool = Depends(get_should_paginate),
+    repository: TenantRepository = Depends(get_repository(TenantRepository)),
+) -> list[Tenant]:
+    # The tenants filter is part of the list, not rendered in aside or modal partials
+    if not should_paginate:
+        return []
+    return await repository.all()
@@ -3,13 +3,13 @@ from pydantic import UUID4
 from sqlalchemy import select
 
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
 from auth.dependencies.repositories import get_repository
 from auth.dependencies.tenant import get_current_tenant
@@ -27,10 +27,11 @@ async def get_paginated_themes(
     pagination: Pagination = Depends(get_pagination),
     ordering: Ordering = Depends(OrderingGetter()),
     repository: ThemeRepository = Depends(ThemeRepository),
-    get_paginated_objects: GetPaginatedObjects[Theme] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[Theme]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(Theme)
 
     if query is not None:
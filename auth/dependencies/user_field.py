@@ -7,13 +7,13 @@ from pydantic.fields import FieldInfo
 from sqlalchemy import select
 
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
 from auth.models import UserField
 from auth.models.user_field import UserFieldType
@@ -43,10 +43,11 @@ async def get_paginated_user_fields(
     pagination: Pagination = Depends(get_pagination),
     ordering: Ordering = Depends(OrderingGetter()),
     repository: UserFieldRepository = Depends(UserFieldRepository),
-    get_paginated_objects: GetPaginatedObjects[UserField] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[UserField]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(UserField)
     return await get_paginated_objects(statement, pagination, ordering, repository)
 
@@ -11,11 +11,10 @@ from sqlalchemy.orm import joinedload
 from auth.crypto.access_token import InvalidAccessToken, read_access_token
 from auth.crypto.password import password_helper
 from auth.dependencies.logger import get_audit_logger
-from auth.dependencies.pagination import (GetPaginatedObjects, Ordering,
-                                          OrderingGetter, PaginatedObjects,
-                                          Pagination,
-                                          get_paginated_objects_getter,
-                                          get_pagination)
+from auth.dependencies.pagination import (Ordering, OrderingGetter,
+                                          PaginatedObjects, Pagination,
+                                          get_paginated_objects,
+                                          get_pagination, get_should_paginate)
 from auth.dependencies.repositories import get_repository
 from auth.dependencies.request import get_request_json
 from auth.dependencies.tasks import get_send_task
@@ -125,10 +124,11 @@ async def get_paginated_users(
     pagination: Pagination = Depends(get_pagination),
     ordering: Ordering = Depends(OrderingGetter()),
     repository: UserRepository = Depends(UserRepository),
-    get_paginated_objects: GetPaginatedObjects[User] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[User]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(User).options(joinedload(User.tenant))
     if query is not None:
         statement = statement.where(User.email_lower.ilike(f"%{query}%"))
@@ -158,10 +158,11 @@ async def get_paginated_user_permissions(
     user_permission_repository: UserPermissionRepository = Depends(
         get_repository(UserPermissionRepository)
     ),
-    get_paginated_objects: GetPaginatedObjects[UserPermission] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[UserPermission]:
+    if not should_paginate:
+        return [], 0
+
     statement = user_permission_repository.get_by_user_statement(user.id)
     return await get_paginated_objects(
         statement, pagination, ordering, user_permission_repository
@@ -185,10 +186,11 @@ async def get_paginated_user_roles(
     user_role_repository: UserRoleRepository = Depends(
         get_repository(UserRoleRepository)
     ),
-    get_paginated_objects: GetPaginatedObjects[UserRole] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[UserRole]:
+    if not should_paginate:
+        return [], 0
+
     statement = user_role_repository.get_by_user_statement(user.id)
     return await get_paginated_objects(
         statement, pagination, ordering, user_role_repository
@@ -212,10 +214,11 @@ async def get_paginated_user_oauth_accounts(
     oauth_account_repository: OAuthAccountRepository = Depends(
         get_repository(OAuthAccountRepository)
     ),
-    get_paginated_objects: GetPaginatedObjects[OAuthAccount] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[OAuthAccount]:
+    if not should_paginate:
+        return [], 0
+
     statement = oauth_account_repository.get_by_user_statement(user.id)
     return await get_paginated_objects(
         statement, pagination, ordering, oauth_account_repository
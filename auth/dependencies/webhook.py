@@ -3,13 +3,13 @@ from pydantic import UUID4
 from sqlalchemy import select
 
 from auth.dependencies.pagination import (
-    GetPaginatedObjects,
     Ordering,
     OrderingGetter,
     PaginatedObjects,
     Pagination,
-    get_paginated_objects_getter,
+    get_paginated_objects,
     get_pagination,
+    get_should_paginate,
 )
 from auth.models import Webhook, WebhookLog
 from auth.repositories import WebhookLogRepository, WebhookRepository
@@ -19,10 +19,11 @@ async def get_paginated_webhooks(
     pagination: Pagination = Depends(get_pagination),
     ordering: Ordering = Depends(OrderingGetter()),
     repository: WebhookRepository = Depends(WebhookRepository),
-    get_paginated_objects: GetPaginatedObjects[Webhook] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[Webhook]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(Webhook)
 
     return await get_paginated_objects(statement, pagination, ordering, repository)
@@ -43,12 +44,13 @@ async def get_webhook_by_id_or_404(
 async def get_paginated_webhook_logs(
     webhook: Webhook = Depends(get_webhook_by_id_or_404),
     pagination: Pagination = Depends(get_pagination),
-    ordering: Ordering = Depends(OrderingGetter([(["created_at"], True)])),
+    ordering: Ordering = Depends(OrderingGetter([(("created_at",), True)])),
     repository: WebhookLogRepository = Depends(WebhookLogRepository),
-    get_paginated_objects: GetPaginatedObjects[WebhookLog] = Depends(
-        get_paginated_objects_getter
-    ),
+    should_paginate: bool = Depends(get_should_paginate),
 ) -> PaginatedObjects[WebhookLog]:
+    if not should_paginate:
+        return [], 0
+
     statement = select(WebhookLog).where(WebhookLog.webhook_id == webhook.id)
 
     return await get_paginated_objects(statement, pagination, ordering, repository)
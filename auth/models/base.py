@@ -1,6 +1,6 @@
 import os
 
-from sqlalchemy import MetaData
+from sqlalchemy import Index, MetaData
 from sqlalchemy.orm import DeclarativeBase
 
 from auth.settings import settings
@@ -16,6 +16,16 @@ def get_prefixed_tablename(name: str) -> str:
     return f"{TABLE_PREFIX}{name}"
 
 
+def get_trigram_index(tablename: str, column: str) -> Index:
+    # Lets ILIKE '%query%' searches use an index; needs the pg_trgm extension
+    return Index(
+        f"ix_{get_prefixed_tablename(tablename)}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
 class Base(DeclarativeBase):
     metadata = MetaData(
         naming_convention={
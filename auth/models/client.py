@@ -1,3 +1,4 @@
+import functools
 import secrets
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
@@ -23,6 +24,7 @@ class ClientType(StrEnum):
     PUBLIC = "public"
     CONFIDENTIAL = "confidential"
 
+    @functools.cache
     def get_display_name(self) -> str:
         display_names = {
             ClientType.PUBLIC: "Public",
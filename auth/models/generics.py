@@ -6,10 +6,12 @@ from typing import Any, TypeVar
 from pydantic import UUID4, AnyUrl
 from sqlalchemy import TIMESTAMP, ColumnElement
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, MappedColumn, mapped_column
 from sqlalchemy.sql import func
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.types import CHAR, TypeDecorator, TypeEngine
 
 
@@ -36,7 +38,8 @@ class GUID(TypeDecorator):
         if value is None:
             return value
         elif dialect.name == "postgresql":
-            return str(value)
+            # Native UUID column: let the driver bind it as binary
+            return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
         else:
             if not isinstance(value, uuid.UUID):
                 return str(uuid.UUID(value))
@@ -81,6 +84,38 @@ class TIMESTAMPAware(TypeDecorator):
         return value
 
 
+class AddDays(FunctionElement[datetime]):
+    """
+    Platform-independent `datetime + days` SQL expression.
+
+    The number of days can be a column, so it can't be
+    a bound interval parameter.
+    """
+
+    type = TIMESTAMPAware(timezone=True)
+    name = "add_days"
+    inherit_cache = True
+
+
+@compiles(AddDays)
+def _compile_add_days(element: AddDays, compiler, **kw) -> str:
+    value, days = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"{value} + make_interval(days => {days})"
+
+
+@compiles(AddDays, "sqlite")
+def _compile_add_days_sqlite(element: AddDays, compiler, **kw) -> str:
+    value, days = (compiler.process(clause, **kw) for clause in element.clauses)
+    # Same text format as the stored timestamps, so they compare as strings
+    return f"strftime('%Y-%m-%d %H:%M:%f', {value}, '+' || {days} || ' days')"
+
+
+@compiles(AddDays, "mysql")
+def _compile_add_days_mysql(element: AddDays, compiler, **kw) -> str:
+    value, days = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"DATE_ADD({value}, INTERVAL {days} DAY)"
+
+
 class CreatedUpdatedAt(BaseModel):
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMPAware(timezone=True),
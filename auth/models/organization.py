@@ -7,7 +7,8 @@ from sqlalchemy import Boolean, Column, Enum, ForeignKey, String, Table, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.schema import UniqueConstraint
 
-from auth.models.base import TABLE_PREFIX, Base, get_prefixed_tablename
+from auth.models.base import (TABLE_PREFIX, Base, get_prefixed_tablename,
+                              get_trigram_index)
 from auth.models.client import Client
 from auth.models.generics import (GUID, CreatedUpdatedAt, ExpiresAt,
                                   PydanticUrlString, UUIDModel)
@@ -25,6 +26,9 @@ class OrganizationRole(StrEnum):
     MEMBER = "member"
 
 
+OWNER_OR_ADMIN_ROLES = frozenset((OrganizationRole.OWNER, OrganizationRole.ADMIN))
+
+
 # Association table for organization member permissions
 OrganizationMemberPermission = Table(
     get_prefixed_tablename("organization_member_permissions"),
@@ -65,7 +69,10 @@ OrganizationInvitationPermission = Table(
 
 class Organization(UUIDModel, CreatedUpdatedAt, Base):
     __tablename__ = "organizations"
-    __table_args__ = (UniqueConstraint("user_id", "name"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "name"),
+        get_trigram_index("organizations", "name"),
+    )
 
     user_id: Mapped[UUID4] = mapped_column(
         GUID,
@@ -78,10 +85,7 @@ class Organization(UUIDModel, CreatedUpdatedAt, Base):
     user: Mapped["User"] = relationship("User")
     # Relationships
     members: Mapped[list["OrganizationMember"]] = relationship(
-        "OrganizationMember",
-        back_populates="organization",
-        lazy="selectin",
-        cascade="all, delete",
+        "OrganizationMember", back_populates="organization", cascade="all, delete"
     )
     invitations: Mapped[list["OrganizationInvitation"]] = relationship(
         "OrganizationInvitation", back_populates="organization", cascade="all, delete"
@@ -92,66 +96,6 @@ class Organization(UUIDModel, CreatedUpdatedAt, Base):
         cascade="all, delete-orphan",
     )
 
-    def get_active_primary_subscription(self) -> "OrganizationSubscription | None":
-        """
-        Get the active primary subscription for this organization.
-
-        Returns:
-            The active primary subscription, or None if not found
-        """
-        from auth.models.organization_subscription import SubscriptionType
-
-        for subscription in self.subscriptions:
-            if (
-                subscription.subscription_type == SubscriptionType.PRIMARY
-                and subscription.is_active
-            ):
-                return subscription
-        return None
-
-    def get_member_limit(self) -> int:
-        """
-        Get the maximum number of members allowed for this organization
-        based on its active primary subscription.
-
-        Returns:
-            int: The member limit (defaults to 1 if no active subscription)
-        """
-        primary_subscription = self.get_active_primary_subscription()
-        if primary_subscription:
-            return primary_subscription.member_limit
-        return 1  # Default limit if no active subscription
-
-    def get_current_member_count(self) -> int:
-        """
-        Get the current number of members in this organization.
-
-        Returns:
-            int: The number of members
-        """
-        return self.members.count()
-
-    def can_add_member(self) -> bool:
-        """
-        Check if the organization can add another member
-        based on its subscription limit.
-
-        Returns:
-            bool: True if a member can be added, False otherwise
-        """
-        return self.get_current_member_count() < self.get_member_limit()
-
-    def get_remaining_seats(self) -> int:
-        """
-        Get the number of remaining seats available for new members.
-
-        Returns:
-            int: The number of remaining seats (0 if at or over limit)
-        """
-        limit = self.get_member_limit()
-        current = self.get_current_member_count()
-        return max(0, limit - current)
-
 
 class OrganizationMember(UUIDModel, CreatedUpdatedAt, Base):
     __tablename__ = "organization_members"
@@ -197,7 +141,7 @@ class OrganizationMember(UUIDModel, CreatedUpdatedAt, Base):
 
     @property
     def is_owner_or_admin(self) -> bool:
-        return self.role in [OrganizationRole.OWNER, OrganizationRole.ADMIN]
+        return self.role in OWNER_OR_ADMIN_ROLES
 
     @property
     def permissions_codenames(self) -> list[str]:
@@ -210,7 +154,10 @@ class OrganizationMember(UUIDModel, CreatedUpdatedAt, Base):
 
 class OrganizationInvitation(UUIDModel, CreatedUpdatedAt, ExpiresAt, Base):
     __tablename__ = "organization_invitations"
-    __table_args__ = (UniqueConstraint("organization_id", "email"),)
+    __table_args__ = (
+        UniqueConstraint("organization_id", "email"),
+        get_trigram_index("organization_invitations", "email"),
+    )
     __lifetime_seconds__ = settings.organization_invitation_lifetime_seconds
 
     organization_id: Mapped[UUID4] = mapped_column(
@@ -248,7 +195,8 @@ class OrganizationInvitation(UUIDModel, CreatedUpdatedAt, ExpiresAt, Base):
         ForeignKey(f"{get_prefixed_tablename('clients')}.id", ondelete="CASCADE"),
         nullable=False,
     )
-    client: Mapped["Client"] = relationship("Client", lazy="joined")
+    # Only needed when accepting an invitation: load it explicitly there
+    client: Mapped["Client"] = relationship("Client", lazy="raise")
     redirect_uri: Mapped[str | None] = mapped_column(
         PydanticUrlString(String)(length=512), default=None, nullable=True
     )
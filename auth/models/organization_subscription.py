@@ -1,15 +1,16 @@
-from datetime import UTC, datetime
+import functools
+from datetime import UTC, datetime, timedelta
 from enum import StrEnum
 
 from pydantic import UUID4
-from sqlalchemy import (Column, ColumnElement, Enum, ForeignKey, Integer,
-                        String, Table, UniqueConstraint, func)
+from sqlalchemy import (Column, ColumnElement, Enum, ForeignKey, Index, Integer,
+                        String, Table, UniqueConstraint, func, text)
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from auth.models.base import TABLE_PREFIX, Base, get_prefixed_tablename
-from auth.models.generics import (GUID, CreatedUpdatedAt, TIMESTAMPAware,
-                                  UUIDModel)
+from auth.models.generics import (GUID, AddDays, CreatedUpdatedAt,
+                                  TIMESTAMPAware, UUIDModel)
 from auth.models.organization import Organization
 from auth.models.role import Role
 from auth.models.subscription import SubscriptionInterval, SubscriptionTier
@@ -24,8 +25,9 @@ class SubscriptionStatus(StrEnum):
     EXPIRED = "expired"
 
     @classmethod
-    def choices(cls) -> list[tuple[str, str]]:
-        return [(item.value, item.value) for item in cls]
+    @functools.cache
+    def choices(cls) -> tuple[tuple[str, str], ...]:
+        return tuple((item.value, item.value) for item in cls)
 
     @classmethod
     def coerce(cls, item):
@@ -52,6 +54,11 @@ OrganizationSubscriptionRole = Table(
 )
 
 
+# Enum columns store member names. expires_at is left out of the index predicate
+# and still has to be checked by the queries.
+ACTIVE_STATUSES_CLAUSE = text("status IN ('ACTIVE', 'TRIALING')")
+
+
 class OrganizationSubscription(UUIDModel, CreatedUpdatedAt, Base):
     __tablename__ = "organization_subscriptions"
     __table_args__ = (
@@ -61,6 +68,13 @@ class OrganizationSubscription(UUIDModel, CreatedUpdatedAt, Base):
             "stripe_subscription_id",
             "status",
         ),
+        Index(
+            f"ix_{get_prefixed_tablename('organization_subscriptions')}_active",
+            "organization_id",
+            "status",
+            postgresql_where=ACTIVE_STATUSES_CLAUSE,
+            sqlite_where=ACTIVE_STATUSES_CLAUSE,
+        ),
     )
 
     tier_id: Mapped[UUID4] = mapped_column(
@@ -71,7 +85,7 @@ class OrganizationSubscription(UUIDModel, CreatedUpdatedAt, Base):
     )
     accounts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     stripe_subscription_id: Mapped[str] = mapped_column(
-        String(length=255), nullable=False
+        String(length=255), nullable=False, index=True
     )
     expires_at: Mapped[datetime] = mapped_column(
         TIMESTAMPAware(timezone=True),
@@ -105,13 +119,13 @@ class OrganizationSubscription(UUIDModel, CreatedUpdatedAt, Base):
         """Calculate when the grace period expires"""
         if not self.expires_at:
             return None
-        return self.expires_at + func.make_interval(0, 0, 0, self.grace_period)
+        return self.expires_at + timedelta(days=self.grace_period or 0)
 
     @grace_expires_at.inplace.expression
     @classmethod
     def _grace_expires_at_expression(cls) -> ColumnElement[datetime]:
         """SQL expression for grace_expires_at"""
-        return cls.expires_at + func.make_interval(0, 0, 0, cls.grace_period)
+        return AddDays(cls.expires_at, func.coalesce(cls.grace_period, 0))
 
     @property
     def is_active(self) -> bool:
@@ -124,6 +138,8 @@ class OrganizationSubscription(UUIDModel, CreatedUpdatedAt, Base):
     @property
     def is_in_grace_period(self) -> bool:
         """Check if the subscription is in grace period"""
+        if not self.expires_at:
+            return False
         now = datetime.now(UTC)
         return (
             not self.is_active and self.expires_at < now and self.grace_expires_at > now
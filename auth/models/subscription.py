@@ -1,3 +1,4 @@
+import functools
 from enum import StrEnum
 
 from pydantic import UUID4
@@ -6,7 +7,8 @@ from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import ForeignKey, Integer, String, Table, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from auth.models.base import TABLE_PREFIX, Base, get_prefixed_tablename
+from auth.models.base import (TABLE_PREFIX, Base, get_prefixed_tablename,
+                              get_trigram_index)
 from auth.models.generics import GUID, CreatedUpdatedAt, UUIDModel
 from auth.models.role import Role
 from auth.models.tenant import Tenant
@@ -33,6 +35,7 @@ SubscriptionRole = Table(
 
 class Subscription(UUIDModel, CreatedUpdatedAt, Base):
     __tablename__ = "subscriptions"
+    __table_args__ = (get_trigram_index("subscriptions", "name"),)
 
     name: Mapped[str] = mapped_column(String(length=255), nullable=False)
     tenant_id: Mapped[UUID4] = mapped_column(
@@ -61,8 +64,9 @@ class SubscriptionInterval(StrEnum):
     YEAR = "year"
 
     @classmethod
-    def choices(cls) -> list[tuple[str, str]]:
-        return [(item.value, item.value) for item in cls]
+    @functools.cache
+    def choices(cls) -> tuple[tuple[str, str], ...]:
+        return tuple((item.value, item.value) for item in cls)
 
     @classmethod
     def coerce(cls, item):
@@ -74,8 +78,9 @@ class SubscriptionTierMode(StrEnum):
     ONE_TIME = "one-time"
 
     @classmethod
-    def choices(cls) -> list[tuple[str, str]]:
-        return [(item.value, item.value) for item in cls]
+    @functools.cache
+    def choices(cls) -> tuple[tuple[str, str], ...]:
+        return tuple((item.value, item.value) for item in cls)
 
     @classmethod
     def coerce(cls, item):
@@ -87,8 +92,9 @@ class SubscriptionTierType(StrEnum):
     ADD_ON = "add-on"
 
     @classmethod
-    def choices(cls) -> list[tuple[str, str]]:
-        return [(item.value, item.value) for item in cls]
+    @functools.cache
+    def choices(cls) -> tuple[tuple[str, str], ...]:
+        return tuple((item.value, item.value) for item in cls)
 
     @classmethod
     def coerce(cls, item):
@@ -4,7 +4,7 @@ from pydantic import UUID4
 from sqlalchemy import Boolean, ForeignKey, String, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from auth.models.base import Base
+from auth.models.base import Base, get_trigram_index
 from auth.models.generics import GUID, CreatedUpdatedAt, UUIDModel
 from auth.models.tenant import Tenant
 from auth.models.user_field import UserField
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
 
 class User(UUIDModel, CreatedUpdatedAt, Base):
     __tablename__ = "users"
+    __table_args__ = (get_trigram_index("users", "email_lower"),)
 
     email: Mapped[str] = mapped_column(
         String(length=320), index=True, nullable=False, unique=True
@@ -43,7 +44,7 @@ class User(UUIDModel, CreatedUpdatedAt, Base):
     )
 
     stripe_customer_id: Mapped[str | None] = mapped_column(
-        String(length=255), nullable=True
+        String(length=255), index=True, nullable=True
     )
 
     def __repr__(self) -> str:
@@ -79,17 +80,8 @@ class User(UUIDModel, CreatedUpdatedAt, Base):
     def get_claims_with_scopes(
         self, user_roles: list["UserRole"], user_permissions: list["UserPermission"]
     ) -> dict[str, Any]:
-        fields = dict(
-            user_field_value.get_slug_and_value(json_serializable=True)
-            for user_field_value in self.user_field_values
-        )
         return {
-            "sub": str(self.id),
-            "email": self.email,
-            "email_verified": self.email_verified,
-            "is_active": self.is_active,
-            "tenant_id": str(self.tenant_id),
-            "fields": fields,
+            **self.get_claims(),
             "scopes": {
                 "tenant": [
                     {
@@ -1,3 +1,4 @@
+import functools
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any, TypedDict
 
@@ -31,6 +32,7 @@ class UserFieldType(StrEnum):
     ADDRESS = "ADDRESS"
     TIMEZONE = "TIMEZONE"
 
+    @functools.cache
     def get_display_name(self) -> str:
         display_names = {
             UserFieldType.STRING: "String",
@@ -3,7 +3,7 @@ from typing import Any, Generic, Protocol, TypeVar, cast
 
 from fastapi import Depends
 from pydantic import UUID4
-from sqlalchemy import delete, func, over, select
+from sqlalchemy import delete, func, lambda_stmt, over, select
 from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute, RelationshipProperty, contains_eager
@@ -27,7 +27,7 @@ class BaseRepositoryProtocol(Protocol[M]):
     ) -> tuple[list[M], int]: ...  # pragma: no cover
 
     def orderize(
-        self, statement: Select, ordering: list[tuple[list[str], bool]]
+        self, statement: Select, ordering: list[tuple[tuple[str, ...], bool]]
     ) -> Select: ...  # pragma: no cover
 
     async def get_one_or_none(
@@ -85,7 +85,7 @@ class BaseRepository(BaseRepositoryProtocol, Generic[M]):
         return results, count
 
     def orderize(
-        self, statement: Select, ordering: list[tuple[list[str], bool]]
+        self, statement: Select, ordering: list[tuple[tuple[str, ...], bool]]
     ) -> Select:
         for accessors, is_desc in ordering:
             field: InstrumentedAttribute
@@ -176,12 +176,16 @@ class UUIDRepositoryMixin(Generic[M_UUID]):
         id: UUID4,
         options: Sequence[Any] | None = None,
     ) -> M_UUID | None:
-        statement = select(self.model).where(self.model.id == id)
+        # Lambda statements are cached by code location,
+        # skipping the construction and cache key computation of the SELECT
+        model = self.model
+        statement = lambda_stmt(lambda: select(model).where(model.id == id))
 
         if options is not None:
-            statement = statement.options(*options)
+            statement += lambda s: s.options(*options)
 
-        return await self.get_one_or_none(statement)
+        result = await self.session.execute(statement)
+        return result.scalar_one_or_none()
 
 
 class ExpiresAtMixin(Generic[M_EXPIRES_AT]):
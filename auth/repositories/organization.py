@@ -2,11 +2,13 @@ import secrets
 from typing import Optional
 
 from pydantic import UUID4
-from sqlalchemy import select
+from sqlalchemy import and_, exists, func, or_, select
 from sqlalchemy.orm import joinedload, selectinload
 
-from auth.models.organization import (Organization, OrganizationInvitation,
-                                      OrganizationMember)
+from auth.models.organization import (OWNER_OR_ADMIN_ROLES, Organization,
+                                      OrganizationInvitation,
+                                      OrganizationMember, OrganizationRole)
+from auth.models.organization_subscription import OrganizationSubscription
 from auth.models.permission import Permission
 from auth.models.user import User
 from auth.repositories.base import (BaseRepository, ExpiresAtMixin,
@@ -19,7 +21,7 @@ class OrganizationRepository(
     model = Organization
 
     async def get_by_user_and_org(
-        self, user_id: str, organization_id: str
+        self, user_id: UUID4, organization_id: UUID4
     ) -> Optional[Organization]:
         statement = select(self.model).where(
             self.model.user_id == user_id, self.model.id == organization_id
@@ -28,7 +30,7 @@ class OrganizationRepository(
         return result.scalar_one_or_none()
 
     async def get_by_user_and_org_name(
-        self, user_id: str, organization_name: str
+        self, user_id: UUID4, organization_name: str
     ) -> Optional[Organization]:
         statement = select(self.model).where(
             self.model.user_id == user_id, self.model.name == organization_name
@@ -37,7 +39,7 @@ class OrganizationRepository(
         return result.scalar_one_or_none()
 
     async def get_by_user_and_org_ids(
-        self, user_id: str, organization_ids: list[UUID4]
+        self, user_id: UUID4, organization_ids: list[UUID4]
     ) -> list[Organization]:
         statement = select(self.model).where(
             self.model.user_id == user_id, self.model.id.in_(organization_ids)
@@ -46,15 +48,23 @@ class OrganizationRepository(
         return result.scalars().all()
 
     async def get_by_id_and_member(
-        self, id: UUID4, user_id: str
+        self, id: UUID4, user_id: UUID4
     ) -> Optional[Organization]:
-        statement = select(self.model).where(
-            self.model.id == id,
-            self.model.members.any(OrganizationMember.user_id == user_id),
+        statement = (
+            select(self.model)
+            .join(self.model.members)
+            .where(self.model.id == id, OrganizationMember.user_id == user_id)
         )
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
+    async def search(self, query: str | None, limit: int = 50) -> list[Organization]:
+        """Get organizations whose name matches the query, ordered by name"""
+        statement = select(self.model).order_by(self.model.name).limit(limit)
+        if query:
+            statement = statement.where(self.model.name.ilike(f"%{query}%"))
+        return await self.list(statement)
+
     async def get_user_with_tenant(self, user_id: UUID4) -> Optional[User]:
         """Get user with tenant relationship loaded"""
         stmt = select(User).options(joinedload(User.tenant)).where(User.id == user_id)
@@ -65,8 +75,10 @@ class OrganizationRepository(
         self, stripe_customer_id: str
     ) -> Optional[Organization]:
         """Get organization by user's Stripe customer ID"""
-        statement = select(self.model).where(
-            self.model.user.has(User.stripe_customer_id == stripe_customer_id),
+        statement = (
+            select(self.model)
+            .join(self.model.user)
+            .where(User.stripe_customer_id == stripe_customer_id)
         )
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
@@ -90,7 +102,7 @@ class OrganizationMemberRepository(
         return await self.list(statement)
 
     async def get_by_user_and_org(
-        self, user_id: str, organization_id: str
+        self, user_id: UUID4, organization_id: UUID4
     ) -> Optional[OrganizationMember]:
         statement = (
             select(self.model)
@@ -103,8 +115,29 @@ class OrganizationMemberRepository(
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
+    async def has_permission(
+        self, user_id: UUID4, organization_id: UUID4, permission_codename: str
+    ) -> bool:
+        """Check in a single query if the member is owner/admin or has the permission"""
+        statement = select(
+            exists().where(
+                self.model.user_id == user_id,
+                self.model.organization_id == organization_id,
+                or_(
+                    self.model.role.in_(OWNER_OR_ADMIN_ROLES),
+                    and_(
+                        self.model.role == OrganizationRole.MEMBER,
+                        self.model.permissions.any(
+                            Permission.codename == permission_codename
+                        ),
+                    ),
+                ),
+            )
+        )
+        return bool(await self.session.scalar(statement))
+
     async def get_by_user_and_org_ids(
-        self, user_id: str, organization_ids: list[UUID4]
+        self, user_id: UUID4, organization_ids: list[UUID4]
     ) -> list[OrganizationMember]:
         statement = select(self.model).where(
             self.model.user_id == user_id,
@@ -113,6 +146,20 @@ class OrganizationMemberRepository(
         result = await self.session.execute(statement)
         return result.scalars().all()
 
+    async def get_owner(self, organization_id: UUID4) -> Optional[OrganizationMember]:
+        """Get the owner of an organization, with its user"""
+        statement = (
+            select(self.model)
+            .where(
+                self.model.organization_id == organization_id,
+                self.model.role == OrganizationRole.OWNER,
+            )
+            .options(joinedload(self.model.user))
+            .limit(1)
+        )
+        result = await self.session.execute(statement)
+        return result.scalar_one_or_none()
+
     async def get_by_organization(
         self, organization_id: UUID4
     ) -> list[OrganizationMember]:
@@ -144,7 +191,9 @@ class OrganizationInvitationRepository(
         statement = (
             select(self.model)
             .where(self.model.token == token)
-            .options(joinedload(self.model.organization))
+            .options(
+                joinedload(self.model.organization), joinedload(self.model.client)
+            )
         )
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
@@ -164,3 +213,21 @@ class OrganizationInvitationRepository(
             self.model.organization_id == organization_id
         )
         return await self._count(statement)
+
+    async def is_limit_reached(self, organization_id: UUID4) -> bool:
+        """
+        Check in a single query if the invitations of the organization
+        reached the accounts granted by its subscriptions
+        """
+        accounts = (
+            select(func.coalesce(func.sum(OrganizationSubscription.accounts), 0))
+            .where(OrganizationSubscription.organization_id == organization_id)
+            .scalar_subquery()
+        )
+        invitations = (
+            select(func.count())
+            .select_from(self.model)
+            .where(self.model.organization_id == organization_id)
+            .scalar_subquery()
+        )
+        return await self.session.scalar(select(invitations >= accounts))
@@ -1,8 +1,9 @@
 from datetime import UTC, datetime
 
 from pydantic import UUID4
-from sqlalchemy import and_, func, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, exists, select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql import Select
 
 from auth.models.organization import Organization
 from auth.models.organization_subscription import (OrganizationSubscription,
@@ -10,7 +11,8 @@ from auth.models.organization_subscription import (OrganizationSubscription,
 from auth.models.permission import Permission
 from auth.models.role import Role
 from auth.models.subscription import (Subscription, SubscriptionTier,
-                                      SubscriptionTierMode)
+                                      SubscriptionTierMode,
+                                      SubscriptionTierType)
 from auth.repositories.base import BaseRepository, UUIDRepositoryMixin
 
 
@@ -27,7 +29,8 @@ class OrganizationSubscriptionRepository(
             OrganizationSubscription.organization_id == organization_id,
             OrganizationSubscription.tier_id == tier_id,
         )
-        return await self.list(statement)
+        # One-time tiers can be bought several times: any of them will do
+        return await self.get_one_or_none(statement.limit(1))
 
     async def get_active_by_organization(
         self, organization_id: UUID4
@@ -46,6 +49,21 @@ class OrganizationSubscriptionRepository(
         )
         return await self.list(statement)
 
+    async def has_active_primary(self, organization_id: UUID4) -> bool:
+        """Check if the organization has an active primary subscription"""
+        now = datetime.now(UTC)
+        statement = select(
+            exists().where(
+                OrganizationSubscription.organization_id == organization_id,
+                OrganizationSubscription.status == SubscriptionStatus.ACTIVE,
+                OrganizationSubscription.grace_expires_at > now,
+                OrganizationSubscription.tier.has(
+                    SubscriptionTier.type == SubscriptionTierType.PRIMARY
+                ),
+            )
+        )
+        return await self.session.scalar(statement)
+
     async def get_all_by_organization(
         self, organization_id: UUID4
     ) -> list[OrganizationSubscription]:
@@ -62,6 +80,23 @@ class OrganizationSubscriptionRepository(
         )
         return await self.list(statement)
 
+    async def count_by_subscription(self, subscription_id: UUID4) -> int:
+        statement = (
+            select(self.model)
+            .join(self.model.tier)
+            .where(SubscriptionTier.subscription_id == subscription_id)
+        )
+        return await self._count(statement)
+
+    async def count_active_by_tier(self, tier_id: UUID4) -> int:
+        statement = select(self.model).where(
+            self.model.tier_id == tier_id,
+            self.model.status.in_(
+                (SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING)
+            ),
+        )
+        return await self._count(statement)
+
     async def get_all_active(self) -> list[OrganizationSubscription]:
         statement = select(self.model).where(
             OrganizationSubscription.status == SubscriptionStatus.ACTIVE,
@@ -105,19 +140,26 @@ class OrganizationSubscriptionRepository(
         )
         return await self.list(statement)
 
-    async def get_organization_accounts(self, organization_id: UUID4) -> int:
-        statement = select(func.sum(self.model.accounts).label("total_accounts")).where(
-            OrganizationSubscription.organization_id == organization_id,
-        )
-        result = await self.session.execute(statement)
-        total = result.scalar()
-        return total or 0
-
     async def get_expired_in_grace_period(
         self, now: datetime
     ) -> list[OrganizationSubscription]:
         """Get subscriptions that have expired but are still in grace period"""
-        statement = (
+        statement = self.get_expired_statement(now).where(
+            OrganizationSubscription.grace_expires_at > now
+        )
+        return await self.list(statement)
+
+    async def get_expired_grace_ended(
+        self, now: datetime
+    ) -> list[OrganizationSubscription]:
+        """Get subscriptions that have expired and grace period has ended"""
+        statement = self.get_expired_statement(now).where(
+            OrganizationSubscription.grace_expires_at <= now
+        )
+        return await self.list(statement)
+
+    def get_expired_statement(self, now: datetime) -> Select:
+        return (
             select(self.model)
             .where(
                 and_(
@@ -137,15 +179,6 @@ class OrganizationSubscriptionRepository(
                 .joinedload(Subscription.tenant),
             )
         )
-        return await self.list(statement)
-
-    async def get_expired_grace_ended(
-        self, now: datetime
-    ) -> list[OrganizationSubscription]:
-        """Get subscriptions that have expired and grace period has ended"""
-        # Using the same query as get_expired_in_grace_period, but filtering will be done
-        # in the caller based on grace_expires_at
-        return await self.get_expired_in_grace_period(now)
 
     async def get_by_organization_with_roles_permissions(
         self, organization_id: UUID4
@@ -163,7 +196,11 @@ class OrganizationSubscriptionRepository(
                 )
             )
             .options(
-                joinedload(OrganizationSubscription.roles).joinedload(Role.permissions),
+                # Both are collections: joining them would repeat each subscription
+                # row for every role and permission pair
+                selectinload(OrganizationSubscription.roles).selectinload(
+                    Role.permissions
+                ),
             )
         )
         return await self.list(statement)
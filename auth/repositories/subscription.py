@@ -1,6 +1,6 @@
 from pydantic import UUID4
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import or_, select
+from sqlalchemy.orm import contains_eager, joinedload
 
 from auth.models.subscription import (Subscription, SubscriptionEvent,
                                       SubscriptionTier)
@@ -60,6 +60,16 @@ class SubscriptionTierRepository(
         )
         return await self.get_one_or_none(statement)
 
+    async def get_by_id_and_subscription(
+        self, id: UUID4, subscription_id: UUID4
+    ) -> SubscriptionTier | None:
+        statement = (
+            select(self.model)
+            .where(self.model.id == id, self.model.subscription_id == subscription_id)
+            .options(joinedload(self.model.subscription))
+        )
+        return await self.get_one_or_none(statement)
+
     async def get_by_stripe_price_id(
         self, stripe_price_id: str
     ) -> SubscriptionTier | None:
@@ -70,8 +80,24 @@ class SubscriptionTierRepository(
         )
         return await self.get_one_or_none(statement)
 
-    async def get_all_with_subscription(self) -> list[SubscriptionTier]:
-        statement = select(self.model).options(joinedload(self.model.subscription))
+    async def search(
+        self, query: str | None, limit: int = 50
+    ) -> list[SubscriptionTier]:
+        """Get tiers whose name or subscription name matches the query"""
+        statement = (
+            select(self.model)
+            .join(self.model.subscription)
+            .options(contains_eager(self.model.subscription))
+            .order_by(Subscription.name, self.model.name)
+            .limit(limit)
+        )
+        if query:
+            statement = statement.where(
+                or_(
+                    self.model.name.ilike(f"%{query}%"),
+                    Subscription.name.ilike(f"%{query}%"),
+                )
+            )
         return await self.list(statement)
 
 
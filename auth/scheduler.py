@@ -3,19 +3,18 @@ from apscheduler.triggers.cron import CronTrigger
 
 from auth import tasks
 
+DAILY_TASKS = (tasks.cleanup, tasks.heartbeat, tasks.subscription_reminder)
+
+
+def send_daily_tasks():
+    for task in DAILY_TASKS:
+        task.send()
+
 
 def schedule():
     scheduler = BlockingScheduler()
     scheduler.add_job(
-        tasks.cleanup.send,
-        CronTrigger.from_crontab("0 0 * * *"),
-    )
-    scheduler.add_job(
-        tasks.heartbeat.send,
-        CronTrigger.from_crontab("0 0 * * *"),
-    )
-    scheduler.add_job(
-        tasks.subscription_reminder.send,
+        send_daily_tasks,
         CronTrigger.from_crontab("0 0 * * *"),
     )
     try:
@@ -1,3 +1,4 @@
+import functools
 from enum import StrEnum
 
 
@@ -10,6 +11,7 @@ class EmailTemplateType(StrEnum):
     SUBSCRIPTION_GRACE_PERIOD = "SUBSCRIPTION_GRACE_PERIOD"
     SUBSCRIPTION_EXPIRED = "SUBSCRIPTION_EXPIRED"
 
+    @functools.cache
     def get_display_name(self) -> str:
         display_names = {
             EmailTemplateType.BASE: "Base",
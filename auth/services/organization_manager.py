@@ -207,7 +207,7 @@ class OrganizationManager:
     ) -> None:
         """Remove member from organization"""
         member = await self.member_repository.get_by_user_and_org(
-            str(user_id), str(organization.id)
+            user_id, organization.id
         )
         if member is None:
             raise OrganizationMemberNotFoundError()
@@ -230,7 +230,7 @@ class OrganizationManager:
     ) -> None:
         """Add a permission to a member"""
         member = await self.member_repository.get_by_user_and_org(
-            str(user_id), str(organization.id)
+            user_id, organization.id
         )
         if member is None:
             raise OrganizationMemberNotFoundError()
@@ -254,7 +254,7 @@ class OrganizationManager:
     ) -> None:
         """Remove a permission from a member"""
         member = await self.member_repository.get_by_user_and_org(
-            str(user_id), str(organization.id)
+            user_id, organization.id
         )
         if member is None:
             raise OrganizationMemberNotFoundError()
@@ -273,17 +273,13 @@ class OrganizationManager:
     async def create_invitation(
         self,
         request: Request,
-        accounts: int,
         organization: Organization,
         invitation_create: schemas.organization.OrganizationInvitationCreate,
         tenant: Tenant,
         client: Client,
     ) -> OrganizationInvitation:
         """Create and send organization invitation"""
-        total_invitations = await self.invitation_repository.count_by_organization(
-            organization.id
-        )
-        if total_invitations >= accounts:
+        if await self.invitation_repository.is_limit_reached(organization.id):
             raise InvitationMaxLimitReachedError()
 
         invitation_exists = await self.invitation_repository.get_by_email_and_org(
@@ -302,7 +298,7 @@ class OrganizationManager:
         # Create invitation with organization reference
         invitation = await self.invitation_repository.create(
             OrganizationInvitation(
-                organization_id=str(organization.id),
+                organization_id=organization.id,
                 email=invitation_create.email,
                 permissions=permissions,
                 client_id=client.id,
@@ -378,27 +374,21 @@ class OrganizationManager:
 
             # Check if user is already a member
             existing_member = await self.member_repository.get_by_user_and_org(
-                str(user_id), str(invitation.organization_id)
+                user_id, invitation.organization_id
             )
             if existing_member is not None:
                 raise OrganizationMemberAlreadyExistsError()
 
-            # Create member with basic role
+            # Create member with the invitation role and direct permissions,
+            # so the association rows are inserted in the same flush
             member = OrganizationMember(
                 organization_id=invitation.organization_id,
                 user_id=user_id,
                 role=invitation.role,
+                permissions=list(invitation.permissions),
             )
             member = await self.member_repository.create(member)
 
-            # Assign direct permissions
-            if invitation.permissions:
-                permissions = await self.permission_repository.get_by_ids(
-                    invitation.permissions
-                )
-                member.permissions.extend(permissions)
-                await self.member_repository.update(member)
-
             # Mark invitation as accepted
             invitation.accepted = True
             await self.invitation_repository.update(invitation)
@@ -5,8 +5,14 @@ from pydantic import UUID4
 
 from auth.models.organization import Organization
 from auth.models.user import User
+from auth.services.cache import TTLCache
 from auth.settings import settings
 
+STRIPE_OBJECTS_CACHE_TTL = 60
+
+_products_cache: TTLCache[str, Any] = TTLCache(ttl=STRIPE_OBJECTS_CACHE_TTL)
+_prices_cache: TTLCache[str, Any] = TTLCache(ttl=STRIPE_OBJECTS_CACHE_TTL)
+
 
 class PaymentService:
     def __init__(self):
@@ -16,17 +22,11 @@ class PaymentService:
         stripe.api_key = settings.stripe_secret_key
         self.webhook_secret = settings.stripe_webhook_secret
 
-    async def create_organization_customer(self, organization: Organization) -> str:
+    async def create_organization_customer(
+        self, organization: Organization, email: str | None
+    ) -> str:
         """Create a payment customer for an organization and return the customer ID."""
-
-        # Find an owner or admin to use as the email contact
-        email = None
-        for member in organization.members:
-            if member.is_owner:
-                email = member.user.email
-                break
-
-        customer = stripe.Customer.create(
+        customer = await stripe.Customer.create_async(
             name=organization.name,
             email=email,
         )
@@ -44,7 +44,7 @@ class PaymentService:
             raise ValueError("User has no associated payment customer")
 
         # Create the portal session with appropriate configuration
-        session = stripe.billing_portal.Session.create(
+        session = await stripe.billing_portal.Session.create_async(
             customer=user.stripe_customer_id,
             return_url=return_url,
         )
@@ -88,12 +88,18 @@ class PaymentService:
         return session.url
 
     async def get_product_from_stripe(self, product_id: str) -> dict[str, Any]:
-        """Get a product from Stripe by ID."""
+        """Get a product from Stripe by ID. Active products are cached for a short time."""
+        product = _products_cache.get(product_id)
+        if product is not None:
+            return product
         try:
             product = await stripe.Product.retrieve_async(product_id)
-            return product
         except stripe.error.StripeError:
             return None
+        # Archived objects are never cached, so they are always checked against Stripe
+        if product.get("active"):
+            _products_cache.set(product_id, product)
+        return product
 
     async def get_prices_for_product(self, product_id: str) -> list[dict[str, Any]]:
         """Get all prices for a product from Stripe."""
@@ -104,12 +110,18 @@ class PaymentService:
             return []
 
     async def get_price_from_stripe(self, price_id: str) -> dict[str, Any]:
-        """Get a price from Stripe by ID."""
+        """Get a price from Stripe by ID. Active prices are cached for a short time."""
+        price = _prices_cache.get(price_id)
+        if price is not None:
+            return price
         try:
             price = await stripe.Price.retrieve_async(price_id)
-            return price
         except stripe.error.StripeError:
             return None
+        # Archived objects are never cached, so they are always checked against Stripe
+        if price.get("active"):
+            _prices_cache.set(price_id, price)
+        return price
 
     async def get_subscription_from_stripe(
         self, subscription_id: str
@@ -276,8 +276,12 @@ class UserManager:
         )
 
         if user_update.fields is not None:
+            user_field_values = {
+                user_field_value.user_field_id: user_field_value
+                for user_field_value in user.user_field_values
+            }
             for user_field in self.user_fields:
-                existing_user_field_value = user.get_user_field_value(user_field)
+                existing_user_field_value = user_field_values.get(user_field.id)
                 # Update existing value
                 if existing_user_field_value is not None:
                     try:
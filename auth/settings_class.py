@@ -49,6 +49,8 @@ class Settings(BaseSettings):
 
     generated_jwk_size: int = 4096
 
+    templates_bytecode_cache_directory: DirectoryPath | None = None
+
     database_type: DatabaseType = DatabaseType.SQLITE
     database_url: str | None = None
     database_host: str | None = None
@@ -62,6 +64,8 @@ class Settings(BaseSettings):
     database_pool_pre_ping: bool = False
     database_pool_size: int = 5
     database_pool_max_overflow: int = 10
+    database_query_cache_size: int = 1200
+    database_sqlite_wal: bool = False
     database_table_prefix: str = "auth_"
 
     redis_url: str = "redis://localhost:6379"
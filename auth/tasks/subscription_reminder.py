@@ -37,29 +37,26 @@ class SubscriptionReminderTask(TaskBase):
             # Create repository
             repository = OrganizationSubscriptionRepository(session)
 
-            # Get all expired subscriptions (some may be in grace period, some may not)
             subscriptions = await repository.get_expired_in_grace_period(now)
 
             for subscription in subscriptions:
-                # Check if still in grace period
-                if subscription.grace_expires_at > now:
-                    organization = subscription.organization
-                    user = organization.user
-                    tenant = subscription.tier.subscription.tenant
-
-                    # Calculate days remaining in grace period
-                    days_remaining = subscription.days_until_grace_period_ends
-
-                    # Only send reminder if there are days remaining
-                    if days_remaining > 0:
-                        await self._send_grace_period_email(
-                            tenant,
-                            user,
-                            organization.name,
-                            organization.id,
-                            days_remaining,
-                            subscription.tier.name,
-                        )
+                organization = subscription.organization
+                user = organization.user
+                tenant = subscription.tier.subscription.tenant
+
+                # Calculate days remaining in grace period
+                days_remaining = subscription.days_until_grace_period_ends
+
+                # Only send reminder if there are days remaining
+                if days_remaining > 0:
+                    await self._send_grace_period_email(
+                        tenant,
+                        user,
+                        organization.name,
+                        organization.id,
+                        days_remaining,
+                        subscription.tier.name,
+                    )
 
     async def _send_grace_period_email(
         self,
@@ -106,27 +103,24 @@ class SubscriptionReminderTask(TaskBase):
             # Create repository
             repository = OrganizationSubscriptionRepository(session)
 
-            # Get all expired subscriptions
             subscriptions = await repository.get_expired_grace_ended(now)
 
             for subscription in subscriptions:
-                # Check if grace period has ended
-                if subscription.grace_expires_at <= now:
-                    organization = subscription.organization
-                    user = subscription.organization.user
-                    tenant = subscription.tier.subscription.tenant
-
-                    # Update subscription status to PAST_DUE using repository
-                    subscription.status = SubscriptionStatus.PAST_DUE
-                    await repository.update(subscription)
-
-                    await self._send_expiration_email(
-                        tenant,
-                        user,
-                        organization.name,
-                        organization.id,
-                        subscription.tier.name,
-                    )
+                organization = subscription.organization
+                user = subscription.organization.user
+                tenant = subscription.tier.subscription.tenant
+
+                # Update subscription status to PAST_DUE using repository
+                subscription.status = SubscriptionStatus.PAST_DUE
+                await repository.update(subscription)
+
+                await self._send_expiration_email(
+                    tenant,
+                    user,
+                    organization.name,
+                    organization.id,
+                    subscription.tier.name,
+                )
 
     async def _send_expiration_email(
         self,
@@ -1,7 +1,8 @@
+import copy
 from typing import Any
 
 from fastapi.templating import Jinja2Templates
-from jinja2 import pass_context, runtime
+from jinja2 import FileSystemBytecodeCache, pass_context, runtime
 from starlette.background import BackgroundTask
 from starlette.requests import Request
 from starlette.routing import Router
@@ -10,10 +11,13 @@ from auth.locale import get_translations
 from auth.services.oauth_provider import get_oauth_provider_branding
 from auth.services.posthog import POSTHOG_API_KEY
 from auth.settings import settings
+from auth.settings_class import Environment
 
 
 @pass_context
 def get_column_macro(context: runtime.Context, column):
+    # Columns may be shared between requests: resolve the macro on a copy
+    column = copy.copy(column)
     column.renderer_macro = context[column.renderer_macro]
     return column
 
@@ -22,6 +26,12 @@ class LocaleJinja2Templates(Jinja2Templates):
     def _create_env(self, directory):
         env = super()._create_env(directory)
         env.add_extension("jinja2.ext.i18n")
+        # Don't stat the template file on every render outside of development
+        env.auto_reload = settings.environment == Environment.DEVELOPMENT
+        if settings.templates_bytecode_cache_directory is not None:
+            env.bytecode_cache = FileSystemBytecodeCache(
+                str(settings.templates_bytecode_cache_directory)
+            )
 
         @pass_context
         def url_path_for(context: dict, name: str, **path_params: Any) -> str:
@@ -0,0 +1,35 @@
+import uuid
+
+import pytest
+
+from auth.apps.dashboard.routers.subscription import get_unknown_role_ids
+from auth.models import Role
+
+ROLE_ID = uuid.UUID("d8e6d9a4-3fcb-4b7a-9a2e-0c5c2a9c3f4e")
+
+
+class TestGetUnknownRoleIds:
+    @pytest.mark.parametrize(
+        "role_id",
+        [
+            "d8e6d9a4-3fcb-4b7a-9a2e-0c5c2a9c3f4e",
+            "D8E6D9A4-3FCB-4B7A-9A2E-0C5C2A9C3F4E",
+            "d8e6d9a43fcb4b7a9a2e0c5c2a9c3f4e",
+            "{d8e6d9a4-3fcb-4b7a-9a2e-0c5c2a9c3f4e}",
+        ],
+    )
+    def test_known(self, role_id: str):
+        roles = [Role(id=ROLE_ID, name="Role")]
+        assert get_unknown_role_ids([role_id], roles) == []
+
+    def test_unknown(self):
+        roles = [Role(id=ROLE_ID, name="Role")]
+        role_ids = [
+            str(ROLE_ID),
+            "0c5c2a9c-3f4e-4b7a-9a2e-d8e6d9a43fcb",
+            "foo",
+        ]
+        assert get_unknown_role_ids(role_ids, roles) == [
+            "0c5c2a9c-3f4e-4b7a-9a2e-d8e6d9a43fcb",
+            "foo",
+        ]
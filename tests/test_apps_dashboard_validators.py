@@ -0,0 +1,63 @@
+import pytest
+from starlette.datastructures import FormData
+from wtforms import Form, StringField
+
+from auth.apps.dashboard.validators import URLValidator, UUIDValidator
+
+
+class TestUUIDValidator:
+    class UUIDForm(Form):
+        value = StringField(validators=[UUIDValidator()])
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "",
+            "foo",
+            "d8e6d9a4-3fcb-4b7a-9a2e",
+            "d8e6d9a4-3fcb-4b7a-9a2e-0c5c2a9c3f4z",
+            "d8e6d9a4-3fcb-4b7a-9a2e-0c5c2a9c3f4e0",
+        ],
+    )
+    def test_invalid(self, value: str):
+        form = TestUUIDValidator.UUIDForm(FormData({"value": value}))
+        assert form.validate() is False
+        assert form.value.errors == ["Invalid UUID."]
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "d8e6d9a4-3fcb-4b7a-9a2e-0c5c2a9c3f4e",
+            "D8E6D9A4-3FCB-4B7A-9A2E-0C5C2A9C3F4E",
+            "d8e6d9a43fcb4b7a9a2e0c5c2a9c3f4e",
+        ],
+    )
+    def test_valid(self, value: str):
+        form = TestUUIDValidator.UUIDForm(FormData({"value": value}))
+        assert form.validate() is True
+
+
+class TestURLValidator:
+    class URLForm(Form):
+        value = StringField(validators=[URLValidator(require_tld=False)])
+
+    @pytest.mark.parametrize(
+        "value",
+        ["", "foo", "example.com", "https://", "https:///path", "https://:8000"],
+    )
+    def test_invalid(self, value: str):
+        form = TestURLValidator.URLForm(FormData({"value": value}))
+        assert form.validate() is False
+        assert form.value.errors == ["Invalid URL."]
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "https://example.com",
+            "http://localhost:8000/webhook",
+            "HTTPS://EXAMPLE.COM/path?query=value",
+        ],
+    )
+    def test_valid(self, value: str):
+        form = TestURLValidator.URLForm(FormData({"value": value}))
+        assert form.validate() is True
@@ -0,0 +1,17 @@
+import pytest
+
+from auth.dependencies.pagination import get_should_paginate
+
+
+@pytest.mark.parametrize(
+    "hx_target,should_paginate",
+    [
+        (None, True),
+        ("body", True),
+        ("aside", False),
+        ("modal", False),
+    ],
+)
+@pytest.mark.asyncio
+async def test_get_should_paginate(hx_target: str | None, should_paginate: bool):
+    assert await get_should_paginate(hx_target) is should_paginate
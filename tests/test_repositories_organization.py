@@ -0,0 +1,144 @@
+import pytest
+import pytest_asyncio
+
+from auth.db import AsyncSession
+from auth.models import (
+    Organization,
+    OrganizationInvitation,
+    OrganizationMember,
+    OrganizationRole,
+    OrganizationSubscription,
+    Subscription,
+    SubscriptionTier,
+)
+from auth.models.subscription import SubscriptionTierMode
+from auth.repositories import (
+    OrganizationInvitationRepository,
+    OrganizationMemberRepository,
+)
+from tests.data import TestData
+
+
+@pytest_asyncio.fixture
+async def organization(main_session: AsyncSession, test_data: TestData) -> Organization:
+    organization = Organization(name="Bretagne", user=test_data["users"]["regular"])
+    main_session.add(organization)
+    await main_session.flush()
+    return organization
+
+
+@pytest.mark.asyncio
+class TestOrganizationMemberRepositoryHasPermission:
+    @pytest.mark.parametrize(
+        "role,permissions,has_permission",
+        [
+            (OrganizationRole.OWNER, [], True),
+            (OrganizationRole.ADMIN, [], True),
+            (OrganizationRole.MEMBER, ["castles:read", "castles:create"], True),
+            (OrganizationRole.MEMBER, ["castles:read"], False),
+            (OrganizationRole.MEMBER, [], False),
+        ],
+    )
+    async def test_has_permission(
+        self,
+        role: OrganizationRole,
+        permissions: list[str],
+        has_permission: bool,
+        main_session: AsyncSession,
+        test_data: TestData,
+        organization: Organization,
+    ):
+        user = test_data["users"]["regular"]
+        main_session.add(
+            OrganizationMember(
+                organization=organization,
+                user=user,
+                role=role,
+                permissions=[
+                    test_data["permissions"][codename] for codename in permissions
+                ],
+            )
+        )
+        await main_session.flush()
+
+        organization_member_repository = OrganizationMemberRepository(main_session)
+
+        assert (
+            await organization_member_repository.has_permission(
+                user.id, organization.id, "castles:create"
+            )
+            is has_permission
+        )
+
+    async def test_not_member(
+        self,
+        main_session: AsyncSession,
+        test_data: TestData,
+        organization: Organization,
+    ):
+        organization_member_repository = OrganizationMemberRepository(main_session)
+
+        assert (
+            await organization_member_repository.has_permission(
+                test_data["users"]["regular"].id, organization.id, "castles:create"
+            )
+            is False
+        )
+
+
+@pytest.mark.asyncio
+class TestOrganizationInvitationRepositoryIsLimitReached:
+    @pytest.mark.parametrize(
+        "accounts,invitations,is_limit_reached",
+        [
+            (None, 0, True),
+            (2, 1, False),
+            (2, 2, True),
+            (2, 3, True),
+        ],
+    )
+    async def test_is_limit_reached(
+        self,
+        accounts: int | None,
+        invitations: int,
+        is_limit_reached: bool,
+        main_session: AsyncSession,
+        test_data: TestData,
+        organization: Organization,
+    ):
+        if accounts is not None:
+            main_session.add(
+                OrganizationSubscription(
+                    tier=SubscriptionTier(
+                        name="Pro monthly",
+                        subscription=Subscription(
+                            name="Pro",
+                            tenant=test_data["tenants"]["default"],
+                            stripe_product_id="prod_limit",
+                        ),
+                        stripe_price_id="price_limit",
+                        mode=SubscriptionTierMode.RECURRING,
+                    ),
+                    organization=organization,
+                    stripe_subscription_id="sub_limit",
+                    accounts=accounts,
+                )
+            )
+        for i in range(invitations):
+            main_session.add(
+                OrganizationInvitation(
+                    organization=organization,
+                    email=f"invitee{i}@bretagne.duchy",
+                    client_id=test_data["clients"]["default_tenant"].id,
+                )
+            )
+        await main_session.flush()
+
+        organization_invitation_repository = OrganizationInvitationRepository(
+            main_session
+        )
+
+        assert (
+            await organization_invitation_repository.is_limit_reached(organization.id)
+            is is_limit_reached
+        )
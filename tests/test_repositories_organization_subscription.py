@@ -0,0 +1,76 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from auth.db import AsyncSession
+from auth.models import (
+    Organization,
+    OrganizationSubscription,
+    Subscription,
+    SubscriptionTier,
+)
+from auth.models.organization_subscription import SubscriptionStatus
+from auth.models.subscription import SubscriptionTierMode, SubscriptionTierType
+from auth.repositories import OrganizationSubscriptionRepository
+from tests.data import TestData
+
+
+@pytest.mark.parametrize(
+    "expires_in_days,grace_period,tier_type,status,has_active_primary",
+    [
+        (10, 7, SubscriptionTierType.PRIMARY, SubscriptionStatus.ACTIVE, True),
+        (-2, 7, SubscriptionTierType.PRIMARY, SubscriptionStatus.ACTIVE, True),
+        (-10, 7, SubscriptionTierType.PRIMARY, SubscriptionStatus.ACTIVE, False),
+        (-2, 0, SubscriptionTierType.PRIMARY, SubscriptionStatus.ACTIVE, False),
+        (10, 7, SubscriptionTierType.PRIMARY, SubscriptionStatus.CANCELED, False),
+        (10, 7, SubscriptionTierType.ADD_ON, SubscriptionStatus.ACTIVE, False),
+    ],
+    ids=[
+        "active",
+        "in_grace_period",
+        "expired",
+        "no_grace_period",
+        "canceled",
+        "add_on",
+    ],
+)
+@pytest.mark.asyncio
+async def test_has_active_primary(
+    expires_in_days: int,
+    grace_period: int,
+    tier_type: SubscriptionTierType,
+    status: SubscriptionStatus,
+    has_active_primary: bool,
+    main_session: AsyncSession,
+    test_data: TestData,
+):
+    organization = Organization(name="Bretagne", user=test_data["users"]["regular"])
+    organization_subscription = OrganizationSubscription(
+        tier=SubscriptionTier(
+            name="Pro monthly",
+            subscription=Subscription(
+                name="Pro",
+                tenant=test_data["tenants"]["default"],
+                stripe_product_id="prod_primary",
+            ),
+            stripe_price_id="price_primary",
+            mode=SubscriptionTierMode.RECURRING,
+            type=tier_type,
+        ),
+        organization=organization,
+        stripe_subscription_id="sub_primary",
+        status=status,
+        expires_at=datetime.now(UTC) + timedelta(days=expires_in_days),
+        grace_period=grace_period,
+    )
+    main_session.add(organization_subscription)
+    await main_session.flush()
+
+    organization_subscription_repository = OrganizationSubscriptionRepository(
+        main_session
+    )
+
+    assert (
+        await organization_subscription_repository.has_active_primary(organization.id)
+        is has_active_primary
+    )
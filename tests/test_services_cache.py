@@ -0,0 +1,41 @@
+import time
+
+from pytest_mock import MockerFixture
+
+from auth.services.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_missing(self):
+        cache: TTLCache[str, int] = TTLCache(ttl=60)
+        assert cache.get("foo") is None
+
+    def test_set_get(self):
+        cache: TTLCache[str, int] = TTLCache(ttl=60)
+        cache.set("foo", 1)
+        assert cache.get("foo") == 1
+
+    def test_expired(self, mocker: MockerFixture):
+        cache: TTLCache[str, int] = TTLCache(ttl=60)
+        cache.set("foo", 1)
+
+        monotonic = time.monotonic()
+        mocker.patch("time.monotonic", return_value=monotonic + 61)
+        assert cache.get("foo") is None
+
+    def test_maxsize(self):
+        cache: TTLCache[str, int] = TTLCache(ttl=60, maxsize=2)
+        cache.set("foo", 1)
+        cache.set("bar", 2)
+        cache.set("baz", 3)
+
+        assert cache.get("foo") is None
+        assert cache.get("bar") == 2
+        assert cache.get("baz") == 3
+
+    def test_delete(self):
+        cache: TTLCache[str, int] = TTLCache(ttl=60)
+        cache.set("foo", 1)
+        cache.delete("foo")
+        cache.delete("bar")
+        assert cache.get("foo") is None
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from auth.db import AsyncSession
+from auth.logger import AuditLogger, logger
+from auth.models import Organization, OrganizationInvitation, OrganizationRole
+from auth.repositories import (
+    OrganizationInvitationRepository,
+    OrganizationMemberRepository,
+    OrganizationRepository,
+    PermissionRepository,
+)
+from auth.services.organization_manager import OrganizationManager
+from tests.data import TestData
+
+
+@pytest.fixture
+def organization_manager(
+    main_session: AsyncSession, send_task_mock: MagicMock
+) -> OrganizationManager:
+    return OrganizationManager(
+        organization_repository=OrganizationRepository(main_session),
+        member_repository=OrganizationMemberRepository(main_session),
+        invitation_repository=OrganizationInvitationRepository(main_session),
+        permission_repository=PermissionRepository(main_session),
+        send_task=send_task_mock,
+        audit_logger=AuditLogger(logger),
+        trigger_webhooks=MagicMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_accept_invitation_copies_permissions(
+    main_session: AsyncSession,
+    test_data: TestData,
+    organization_manager: OrganizationManager,
+) -> None:
+    user = test_data["users"]["regular_secondary"]
+    permissions = [
+        test_data["permissions"]["castles:read"],
+        test_data["permissions"]["castles:create"],
+    ]
+    invitation = OrganizationInvitation(
+        organization=Organization(name="Bretagne", user=test_data["users"]["regular"]),
+        email=user.email,
+        role=OrganizationRole.MEMBER,
+        client_id=test_data["clients"]["default_tenant"].id,
+        permissions=permissions,
+    )
+    main_session.add(invitation)
+    await main_session.flush()
+
+    accepted_invitation = await organization_manager.accept_invitation(
+        invitation.token, user.id
+    )
+    assert accepted_invitation.accepted is True
+
+    member = await OrganizationMemberRepository(main_session).get_by_user_and_org(
+        user.id, invitation.organization_id
+    )
+    assert member is not None
+    assert member.role == OrganizationRole.MEMBER
+    assert sorted(member.permissions_codenames) == ["castles:create", "castles:read"]
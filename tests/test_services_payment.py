@@ -0,0 +1,108 @@
+from collections.abc import Generator
+from unittest.mock import AsyncMock
+
+import pytest
+import stripe
+from pytest_mock import MockerFixture
+
+from auth.services import payment
+from auth.services.payment import PaymentService
+
+
+@pytest.fixture(autouse=True)
+def clear_stripe_caches() -> Generator[None, None, None]:
+    yield
+    payment._products_cache.clear()
+    payment._prices_cache.clear()
+
+
+@pytest.fixture
+def payment_service(mocker: MockerFixture) -> PaymentService:
+    mocker.patch.object(payment.settings, "stripe_secret_key", "sk_test")
+    return PaymentService()
+
+
+def get_stripe_object(
+    cls: type[stripe.StripeObject], id: str, *, active: bool
+) -> stripe.StripeObject:
+    return cls.construct_from({"id": id, "active": active}, "sk_test")
+
+
+@pytest.mark.asyncio
+class TestGetProductFromStripe:
+    async def test_cached_when_active(
+        self, payment_service: PaymentService, mocker: MockerFixture
+    ):
+        product = get_stripe_object(stripe.Product, "prod_active", active=True)
+        retrieve_mock = mocker.patch.object(
+            stripe.Product, "retrieve_async", AsyncMock(return_value=product)
+        )
+
+        assert await payment_service.get_product_from_stripe("prod_active") == product
+        assert await payment_service.get_product_from_stripe("prod_active") == product
+        retrieve_mock.assert_awaited_once_with("prod_active")
+
+    async def test_not_cached_when_archived(
+        self, payment_service: PaymentService, mocker: MockerFixture
+    ):
+        product = get_stripe_object(stripe.Product, "prod_archived", active=False)
+        retrieve_mock = mocker.patch.object(
+            stripe.Product, "retrieve_async", AsyncMock(return_value=product)
+        )
+
+        assert await payment_service.get_product_from_stripe("prod_archived") == product
+        assert await payment_service.get_product_from_stripe("prod_archived") == product
+        assert retrieve_mock.await_count == 2
+
+    async def test_not_found(
+        self, payment_service: PaymentService, mocker: MockerFixture
+    ):
+        retrieve_mock = mocker.patch.object(
+            stripe.Product,
+            "retrieve_async",
+            AsyncMock(side_effect=stripe.error.InvalidRequestError("Not found", None)),
+        )
+
+        assert await payment_service.get_product_from_stripe("prod_unknown") is None
+        assert await payment_service.get_product_from_stripe("prod_unknown") is None
+        assert retrieve_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+class TestGetPriceFromStripe:
+    async def test_cached_when_active(
+        self, payment_service: PaymentService, mocker: MockerFixture
+    ):
+        price = get_stripe_object(stripe.Price, "price_active", active=True)
+        retrieve_mock = mocker.patch.object(
+            stripe.Price, "retrieve_async", AsyncMock(return_value=price)
+        )
+
+        assert await payment_service.get_price_from_stripe("price_active") == price
+        assert await payment_service.get_price_from_stripe("price_active") == price
+        retrieve_mock.assert_awaited_once_with("price_active")
+
+    async def test_not_cached_when_archived(
+        self, payment_service: PaymentService, mocker: MockerFixture
+    ):
+        price = get_stripe_object(stripe.Price, "price_archived", active=False)
+        retrieve_mock = mocker.patch.object(
+            stripe.Price, "retrieve_async", AsyncMock(return_value=price)
+        )
+
+        assert await payment_service.get_price_from_stripe("price_archived") == price
+        assert await payment_service.get_price_from_stripe("price_archived") == price
+        assert retrieve_mock.await_count == 2
+
+    async def test_not_found(
+        self, payment_service: PaymentService, mocker: MockerFixture
+    ):
+        retrieve_mock = mocker.patch.object(
+            stripe.Price,
+            "retrieve_async",
+            AsyncMock(side_effect=stripe.error.InvalidRequestError("Not found", None)),
+        )
+
+        assert await payment_service.get_price_from_stripe("price_unknown") is None
+        assert await payment_service.get_price_from_stripe("price_unknown") is None
+        assert retrieve_mock.await_count == 2
@@ -0,0 +1,109 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from pytest_mock import MockerFixture
+
+from auth.db import AsyncSession
+from auth.models import (
+    Organization,
+    OrganizationSubscription,
+    Subscription,
+    SubscriptionTier,
+)
+from auth.models.organization_subscription import SubscriptionStatus
+from auth.models.subscription import SubscriptionTierMode, SubscriptionTierType
+from auth.services.email import EmailProvider
+from auth.tasks.subscription_reminder import SubscriptionReminderTask
+from tests.data import TestData
+
+
+@pytest_asyncio.fixture
+async def subscription_tier(
+    main_session: AsyncSession, test_data: TestData
+) -> SubscriptionTier:
+    subscription = Subscription(
+        name="Pro",
+        tenant=test_data["tenants"]["default"],
+        stripe_product_id="prod_reminder",
+    )
+    subscription_tier = SubscriptionTier(
+        name="Pro monthly",
+        subscription=subscription,
+        stripe_price_id="price_reminder",
+        mode=SubscriptionTierMode.RECURRING,
+        type=SubscriptionTierType.PRIMARY,
+    )
+    main_session.add(subscription_tier)
+    await main_session.flush()
+    return subscription_tier
+
+
+@pytest_asyncio.fixture
+async def organization_subscriptions(
+    main_session: AsyncSession,
+    test_data: TestData,
+    subscription_tier: SubscriptionTier,
+) -> dict[str, OrganizationSubscription]:
+    now = datetime.now(UTC)
+    expirations = {
+        "active": (now + timedelta(days=10), 7),
+        "in_grace_period": (now - timedelta(days=2), 7),
+        "no_grace_period": (now - timedelta(days=2), 0),
+        "grace_period_ended": (now - timedelta(days=10), 7),
+    }
+    user = test_data["users"]["regular"]
+    organization_subscriptions = {
+        alias: OrganizationSubscription(
+            tier=subscription_tier,
+            organization=Organization(name=alias, user=user),
+            stripe_subscription_id=f"sub_{alias}",
+            status=SubscriptionStatus.ACTIVE,
+            expires_at=expires_at,
+            grace_period=grace_period,
+        )
+        for alias, (expires_at, grace_period) in expirations.items()
+    }
+    main_session.add_all(organization_subscriptions.values())
+    await main_session.flush()
+    return organization_subscriptions
+
+
+@pytest.mark.asyncio
+class TestTasksSubscriptionReminder:
+    async def test_reminder(
+        self,
+        main_session_manager,
+        organization_subscriptions: dict[str, OrganizationSubscription],
+        mocker: MockerFixture,
+    ):
+        subscription_reminder = SubscriptionReminderTask(
+            main_session_manager, MagicMock(spec=EmailProvider)
+        )
+        send_grace_period_email_mock = mocker.patch.object(
+            subscription_reminder, "_send_grace_period_email"
+        )
+        send_expiration_email_mock = mocker.patch.object(
+            subscription_reminder, "_send_expiration_email"
+        )
+
+        await subscription_reminder.run()
+
+        send_grace_period_email_mock.assert_called_once()
+        assert send_grace_period_email_mock.call_args[0][2] == "in_grace_period"
+
+        assert sorted(
+            call[0][2] for call in send_expiration_email_mock.call_args_list
+        ) == ["grace_period_ended", "no_grace_period"]
+
+        statuses = {
+            alias: organization_subscription.status
+            for alias, organization_subscription in organization_subscriptions.items()
+        }
+        assert statuses == {
+            "active": SubscriptionStatus.ACTIVE,
+            "in_grace_period": SubscriptionStatus.ACTIVE,
+            "no_grace_period": SubscriptionStatus.PAST_DUE,
+            "grace_period_ended": SubscriptionStatus.PAST_DUE,
+        }